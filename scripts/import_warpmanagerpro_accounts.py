@@ -4,20 +4,44 @@ from __future__ import annotations
 import argparse
 import json
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 import httpx
 
-
-def _load_json(path: Path) -> dict[str, Any]:
-    return json.loads(path.read_text(encoding="utf-8"))
-
-
-def _convert_accounts(raw: dict[str, Any]) -> dict[str, Any]:
+try:
+    import ijson
+except ImportError:  # pragma: no cover - scripts extra not installed, falls back to full parse
+    ijson = None
+
+try:
+    import orjson
+
+    def _dump_json_bytes(obj: Any, *, indent: bool = False) -> bytes:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+except ImportError:  # pragma: no cover - orjson is a declared dependency
+    def _dump_json_bytes(obj: Any, *, indent: bool = False) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode()
+
+
+def _iter_source_accounts(path: Path) -> Iterator[Any]:
+    """Yield raw account entries without materializing the whole file.
+
+    Uses ijson to stream `accounts[*]` so peak memory stays flat for large
+    WarpManagerPro exports; falls back to a full json.loads when ijson is
+    unavailable.
+    """
+    if ijson is not None:
+        with path.open("rb") as f:
+            yield from ijson.items(f, "accounts.item")
+        return
+    raw = json.loads(path.read_text(encoding="utf-8"))
     src_accounts = raw.get("accounts") if isinstance(raw, dict) else []
-    if not isinstance(src_accounts, list):
-        src_accounts = []
+    if isinstance(src_accounts, list):
+        yield from src_accounts
+
 
+def _convert_accounts(src_accounts: Iterable[Any]) -> dict[str, Any]:
     out_accounts: list[dict[str, Any]] = []
     for item in src_accounts:
         if not isinstance(item, dict):
@@ -38,12 +62,32 @@ def _convert_accounts(raw: dict[str, Any]) -> dict[str, Any]:
     return {"accounts": out_accounts}
 
 
-def _post_import(endpoint: str, payload: dict[str, Any], admin_token: str, timeout: float) -> dict[str, Any]:
+def _make_client(timeout: float) -> httpx.Client:
+    return httpx.Client(
+        http2=True,
+        timeout=timeout,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+        verify=True,
+        follow_redirects=True,
+    )
+
+
+def _post_import(
+    endpoint: str,
+    payload: dict[str, Any],
+    admin_token: str,
+    timeout: float,
+    client: httpx.Client | None = None,
+) -> dict[str, Any]:
     headers = {"Content-Type": "application/json"}
     if admin_token:
         headers["Authorization"] = f"Bearer {admin_token}"
-    with httpx.Client(timeout=timeout, verify=True, follow_redirects=True) as client:
-        resp = client.post(endpoint, headers=headers, json=payload)
+    body = _dump_json_bytes(payload)
+    if client is not None:
+        resp = client.post(endpoint, headers=headers, content=body)
+    else:
+        with _make_client(timeout) as own_client:
+            resp = own_client.post(endpoint, headers=headers, content=body)
     if resp.status_code >= 400:
         raise RuntimeError(f"HTTP {resp.status_code}: {resp.text[:500]}")
     return resp.json()
@@ -90,8 +134,7 @@ def main() -> int:
     if not input_path.exists():
         raise FileNotFoundError(f"Input file not found: {input_path}")
 
-    raw = _load_json(input_path)
-    payload = _convert_accounts(raw)
+    payload = _convert_accounts(_iter_source_accounts(input_path))
     count = len(payload["accounts"])
     print(f"source: {input_path}")
     print(f"converted accounts: {count}")
@@ -99,7 +142,7 @@ def main() -> int:
     if args.out:
         out_path = Path(args.out).expanduser()
         out_path.parent.mkdir(parents=True, exist_ok=True)
-        out_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        out_path.write_bytes(_dump_json_bytes(payload, indent=True))
         print(f"written: {out_path}")
 
     if args.dry_run:
@@ -2,33 +2,50 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import json
+import re
 from typing import Any
 
 import httpx
 
+# Cap concurrent probes so we multiplex without hammering the gateway.
+_MAX_CONCURRENCY = 8
+
+# One compiled alternation instead of five sequential substring scans.
+_CLASSIFIER = re.compile(
+    r"(not allowed for your account"
+    r"|no remaining quota"
+    r"|no ai requests remaining"
+    r"|unsupported model"
+    r"|model not found)",
+    re.IGNORECASE,
+)
+_CLASSIFIER_LABELS = {
+    "not allowed for your account": "not_allowed",
+    "no remaining quota": "quota_exhausted",
+    "no ai requests remaining": "quota_exhausted",
+    "unsupported model": "unsupported_model",
+    "model not found": "unsupported_model",
+}
+
 
 def _classify(status_code: int, body: Any) -> str:
-    raw = ""
+    if status_code == 200:
+        return "ok"
     if isinstance(body, dict):
         raw = json.dumps(body, ensure_ascii=False)
     else:
         raw = str(body or "")
-    low = raw.lower()
-    if status_code == 200:
-        return "ok"
-    if "not allowed for your account" in low:
-        return "not_allowed"
-    if "no remaining quota" in low or "no ai requests remaining" in low:
-        return "quota_exhausted"
-    if "unsupported model" in low or "model not found" in low:
-        return "unsupported_model"
+    m = _CLASSIFIER.search(raw)
+    if m:
+        return _CLASSIFIER_LABELS[m.group(1).lower()]
     return f"http_{status_code}"
 
 
-def _load_models(client: httpx.Client, base_url: str, api_token: str) -> list[str]:
+async def _load_models(client: httpx.AsyncClient, base_url: str, api_token: str) -> list[str]:
     headers = {"Authorization": f"Bearer {api_token}"}
-    r = client.get(f"{base_url.rstrip('/')}/v1/models", headers=headers)
+    r = await client.get(f"{base_url.rstrip('/')}/v1/models", headers=headers)
     r.raise_for_status()
     data = r.json()
     models = []
@@ -39,6 +56,33 @@ def _load_models(client: httpx.Client, base_url: str, api_token: str) -> list[st
     return models
 
 
+async def _probe_model(
+    client: httpx.AsyncClient,
+    sem: asyncio.Semaphore,
+    base_url: str,
+    headers: dict[str, str],
+    model: str,
+) -> str:
+    payload = {
+        "model": model,
+        "max_tokens": 32,
+        "messages": [{"role": "user", "content": "ping"}],
+        "stream": False,
+    }
+    async with sem:
+        try:
+            resp = await client.post(f"{base_url}/v1/messages", headers=headers, json=payload)
+        except Exception as e:
+            return f"{model}\terror\t{e}"
+    body: Any
+    try:
+        body = resp.json()
+    except Exception:
+        body = resp.text[:400]
+    status = _classify(resp.status_code, body)
+    return f"{model}\t{status}\tHTTP {resp.status_code}"
+
+
 def main() -> int:
     p = argparse.ArgumentParser(description="Probe model availability via remote /v1/messages endpoint.")
     p.add_argument("--endpoint", required=True, help="Gateway base URL, e.g. https://warp.example.com")
@@ -59,32 +103,27 @@ def main() -> int:
         "content-type": "application/json",
     }
 
-    with httpx.Client(timeout=args.timeout, verify=True, follow_redirects=True) as client:
-        if args.from_server_models:
-            model_ids = _load_models(client, base_url, args.api_token)
-        else:
-            model_ids = [m.strip() for m in args.models.split(",") if m.strip()]
-
-        print(f"endpoint={base_url}")
-        print(f"models={len(model_ids)}")
-        for model in model_ids:
-            payload = {
-                "model": model,
-                "max_tokens": 32,
-                "messages": [{"role": "user", "content": "ping"}],
-                "stream": False,
-            }
-            try:
-                resp = client.post(f"{base_url}/v1/messages", headers=headers, json=payload)
-                body: Any
-                try:
-                    body = resp.json()
-                except Exception:
-                    body = resp.text[:400]
-                status = _classify(resp.status_code, body)
-                print(f"{model}\t{status}\tHTTP {resp.status_code}")
-            except Exception as e:
-                print(f"{model}\terror\t{e}")
+    async def _run() -> None:
+        async with httpx.AsyncClient(
+            http2=True,
+            timeout=args.timeout,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+            verify=True,
+            follow_redirects=True,
+        ) as client:
+            if args.from_server_models:
+                model_ids = await _load_models(client, base_url, args.api_token)
+            else:
+                model_ids = [m.strip() for m in args.models.split(",") if m.strip()]
+
+            print(f"endpoint={base_url}")
+            print(f"models={len(model_ids)}")
+            sem = asyncio.Semaphore(_MAX_CONCURRENCY)
+            tasks = [_probe_model(client, sem, base_url, headers, model) for model in model_ids]
+            for line in await asyncio.gather(*tasks):
+                print(line)
+
+    asyncio.run(_run())
     return 0
 
 
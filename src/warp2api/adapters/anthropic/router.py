@@ -5,7 +5,7 @@ Converts POST /v1/messages (Anthropic format) into internal OpenAI chat completi
 from __future__ import annotations
 
 import json
-import uuid
+import os
 from typing import Any, Dict, List
 
 from fastapi import APIRouter, HTTPException, Request
@@ -19,9 +19,21 @@ from warp2api.adapters.common.schemas import (
     OpenAITool,
 )
 from warp2api.application.services.chat_gateway_service import execute_chat_completions
+from warp2api.infrastructure.utils.json import json_dumpb, json_loads
 
 router = APIRouter()
 
+# Shared empty-container sentinels: .get() defaults like {} / [{}] would
+# otherwise allocate a fresh object per call.
+_EMPTY: Dict[str, Any] = {}
+_EMPTY_LIST: List[Any] = []
+_NO_CHOICES: List[Dict[str, Any]] = [_EMPTY]
+
+
+def _mkid(prefix: str) -> str:
+    # Cheaper than uuid4: one urandom read, no UUID formatting.
+    return prefix + os.urandom(12).hex()
+
 
 def _anthropic_content_to_openai(content) -> str:
     if isinstance(content, str):
@@ -30,11 +42,12 @@ def _anthropic_content_to_openai(content) -> str:
         parts = []
         for block in content:
             if isinstance(block, dict):
-                if block.get("type") == "text":
+                btype = block.get("type")
+                if btype == "text":
                     parts.append(block.get("text", ""))
-                elif block.get("type") == "image":
+                elif btype == "image":
                     parts.append("[image]")
-                elif block.get("type") == "tool_result":
+                elif btype == "tool_result":
                     parts.append(str(block.get("content", "")))
             elif isinstance(block, str):
                 parts.append(block)
@@ -48,64 +61,89 @@ def _convert_anthropic_to_openai(body: Dict[str, Any]) -> ChatCompletionsRequest
     system = body.get("system")
     if system:
         if isinstance(system, list):
-            system = "\n".join(b.get("text", "") if isinstance(b, dict) else str(b) for b in system)
-        messages.append(ChatMessage(role="system", content=system))
-
-    for msg in body.get("messages", []):
+            # Fast-path the single-block list that real clients overwhelmingly send.
+            if len(system) == 1:
+                b = system[0]
+                system = b.get("text", "") if isinstance(b, dict) else str(b)
+            else:
+                system = "\n".join(b.get("text", "") if isinstance(b, dict) else str(b) for b in system)
+        messages.append(ChatMessage.model_construct(role="system", content=system))
+
+    for msg in body.get("messages") or _EMPTY_LIST:
         role = msg.get("role", "user")
         content = msg.get("content", "")
 
-        if role == "user" and isinstance(content, list):
-            for block in content:
-                if isinstance(block, dict) and block.get("type") == "tool_result":
-                    messages.append(
-                        ChatMessage(
-                            role="tool",
-                            content=_anthropic_content_to_openai(block.get("content", "")),
-                            tool_call_id=block.get("tool_use_id", ""),
-                        )
+        if not isinstance(content, list):
+            openai_role = "assistant" if role == "assistant" else "user"
+            messages.append(ChatMessage.model_construct(role=openai_role, content=_anthropic_content_to_openai(content)))
+            continue
+
+        # Single pass over the blocks: classify by type once instead of
+        # re-scanning the list per block kind.
+        text_parts: List[str] = []
+        flat_parts: List[str] = []
+        tool_results: List[Dict[str, Any]] = []
+        tool_uses: List[Dict[str, Any]] = []
+        for block in content:
+            if isinstance(block, dict):
+                btype = block.get("type")
+                if btype == "text":
+                    txt = block.get("text", "")
+                    text_parts.append(txt)
+                    flat_parts.append(txt)
+                elif btype == "tool_result":
+                    tool_results.append(block)
+                    flat_parts.append(str(block.get("content", "")))
+                elif btype == "tool_use":
+                    tool_uses.append(block)
+                elif btype == "image":
+                    flat_parts.append("[image]")
+            elif isinstance(block, str):
+                flat_parts.append(block)
+
+        if role == "user":
+            for block in tool_results:
+                messages.append(
+                    ChatMessage.model_construct(
+                        role="tool",
+                        content=_anthropic_content_to_openai(block.get("content", "")),
+                        tool_call_id=block.get("tool_use_id", ""),
                     )
-            text_parts = [b.get("text", "") for b in content if isinstance(b, dict) and b.get("type") == "text"]
+                )
             if text_parts:
-                messages.append(ChatMessage(role="user", content="\n".join(text_parts)))
+                messages.append(ChatMessage.model_construct(role="user", content="\n".join(text_parts)))
         else:
             openai_role = "assistant" if role == "assistant" else "user"
-            text = _anthropic_content_to_openai(content)
             tool_calls = None
-            if role == "assistant" and isinstance(content, list):
-                tc_list = []
-                for block in content:
-                    if isinstance(block, dict) and block.get("type") == "tool_use":
-                        tc_list.append(
-                            {
-                                "id": block.get("id", str(uuid.uuid4())),
-                                "type": "function",
-                                "function": {
-                                    "name": block.get("name", ""),
-                                    "arguments": json.dumps(block.get("input", {}), ensure_ascii=False),
-                                },
-                            }
-                        )
-                if tc_list:
-                    tool_calls = tc_list
-            messages.append(ChatMessage(role=openai_role, content=text, tool_calls=tool_calls))
+            if role == "assistant" and tool_uses:
+                tool_calls = [
+                    {
+                        "id": block.get("id") or _mkid(""),
+                        "type": "function",
+                        "function": {
+                            "name": block.get("name", ""),
+                            "arguments": json.dumps(block.get("input", {}), ensure_ascii=False),
+                        },
+                    }
+                    for block in tool_uses
+                ]
+            messages.append(ChatMessage.model_construct(role=openai_role, content="\n".join(flat_parts), tool_calls=tool_calls))
 
     tools = None
     if body.get("tools"):
-        tools = []
-        for t in body["tools"]:
-            tools.append(
-                OpenAITool(
-                    type="function",
-                    function=OpenAIFunctionDef(
-                        name=t.get("name", ""),
-                        description=t.get("description"),
-                        parameters=t.get("input_schema"),
-                    ),
-                )
+        tools = [
+            OpenAITool.model_construct(
+                type="function",
+                function=OpenAIFunctionDef.model_construct(
+                    name=t.get("name", ""),
+                    description=t.get("description"),
+                    parameters=t.get("input_schema"),
+                ),
             )
+            for t in body["tools"]
+        ]
 
-    return ChatCompletionsRequest(
+    return ChatCompletionsRequest.model_construct(
         model=body.get("model"),
         messages=messages,
         stream=body.get("stream", False),
@@ -113,33 +151,34 @@ def _convert_anthropic_to_openai(body: Dict[str, Any]) -> ChatCompletionsRequest
     )
 
 
+def _tool_use_block(tc: Dict[str, Any]) -> Dict[str, Any]:
+    func = tc.get("function") or _EMPTY
+    try:
+        input_data = json_loads(func.get("arguments", "{}"))
+    except Exception:
+        input_data = {}
+    return {
+        "type": "tool_use",
+        "id": tc.get("id") or _mkid(""),
+        "name": func.get("name", ""),
+        "input": input_data,
+    }
+
+
 def _openai_response_to_anthropic(openai_resp: Dict[str, Any], model: str) -> Dict[str, Any]:
-    choice = openai_resp.get("choices", [{}])[0]
-    msg = choice.get("message", {})
-    content_blocks = []
+    choice = (openai_resp.get("choices") or _NO_CHOICES)[0]
+    msg = choice.get("message") or _EMPTY
 
     text = msg.get("content", "")
-    if text:
-        content_blocks.append({"type": "text", "text": text})
+    content_blocks: List[Dict[str, Any]] = [{"type": "text", "text": text}] if text else []
 
-    for tc in msg.get("tool_calls", []):
-        func = tc.get("function", {})
-        try:
-            input_data = json.loads(func.get("arguments", "{}"))
-        except Exception:
-            input_data = {}
-        content_blocks.append(
-            {
-                "type": "tool_use",
-                "id": tc.get("id", str(uuid.uuid4())),
-                "name": func.get("name", ""),
-                "input": input_data,
-            }
-        )
+    tool_calls = msg.get("tool_calls")
+    if tool_calls:
+        content_blocks.extend(_tool_use_block(tc) for tc in tool_calls)
 
     stop_reason = "tool_use" if choice.get("finish_reason") == "tool_calls" else "end_turn"
     return {
-        "id": f"msg_{uuid.uuid4().hex[:24]}",
+        "id": _mkid("msg_"),
         "type": "message",
         "role": "assistant",
         "content": content_blocks,
@@ -150,60 +189,79 @@ def _openai_response_to_anthropic(openai_resp: Dict[str, Any], model: str) -> Di
     }
 
 
+# Constant SSE frames and per-delta prefixes, precomputed so the per-token loop
+# only JSON-encodes the variable part (the delta text / partial JSON).
+_TEXT_DELTA_PREFIX = b'event: content_block_delta\ndata: {"type":"content_block_delta","index":0,"delta":{"type":"text_delta","text":'
+_TOOL_DELTA_PREFIX = b'event: content_block_delta\ndata: {"type":"content_block_delta","index":1,"delta":{"type":"input_json_delta","partial_json":'
+_DELTA_SUFFIX = b"}}\n\n"
+_BLOCK_STOP_0 = b'event: content_block_stop\ndata: {"type":"content_block_stop","index":0}\n\n'
+_BLOCK_STOP_1 = b'event: content_block_stop\ndata: {"type":"content_block_stop","index":1}\n\n'
+_MESSAGE_STOP = b'event: message_stop\ndata: {"type":"message_stop"}\n\n'
+
+
 async def _openai_sse_to_anthropic_sse(openai_stream, model: str):
-    msg_id = f"msg_{uuid.uuid4().hex[:24]}"
-    yield f"event: message_start\ndata: {json.dumps({'type': 'message_start', 'message': {'id': msg_id, 'type': 'message', 'role': 'assistant', 'content': [], 'model': model, 'stop_reason': None, 'stop_sequence': None, 'usage': {'input_tokens': 0, 'output_tokens': 0}}})}\n\n"
-    yield f"event: content_block_start\ndata: {json.dumps({'type': 'content_block_start', 'index': 0, 'content_block': {'type': 'text', 'text': ''}})}\n\n"
+    msg_id = _mkid("msg_")
+    yield b"event: message_start\ndata: " + json_dumpb({"type": "message_start", "message": {"id": msg_id, "type": "message", "role": "assistant", "content": [], "model": model, "stop_reason": None, "stop_sequence": None, "usage": {"input_tokens": 0, "output_tokens": 0}}}) + b"\n\n"
+    yield b'event: content_block_start\ndata: {"type":"content_block_start","index":0,"content_block":{"type":"text","text":""}}\n\n'
 
     tool_index = 0
     in_tool = False
 
     async for chunk_line in openai_stream:
-        if not chunk_line.startswith("data: "):
+        # The gateway generator yields bytes frames; tolerate str for any
+        # other upstream.
+        if isinstance(chunk_line, str):
+            chunk_line = chunk_line.encode("utf-8")
+        if not chunk_line.startswith(b"data: "):
             continue
         payload = chunk_line[6:].strip()
-        if payload == "[DONE]":
+        if payload == b"[DONE]":
             break
         try:
-            chunk = json.loads(payload)
+            chunk = json_loads(payload)
         except Exception:
             continue
 
-        delta = chunk.get("choices", [{}])[0].get("delta", {})
-        finish = chunk.get("choices", [{}])[0].get("finish_reason")
+        choices = chunk.get("choices")
+        ch0 = choices[0] if choices else _EMPTY
+        delta = ch0.get("delta") or _EMPTY
+        finish = ch0.get("finish_reason")
 
         text = delta.get("content")
         if text:
-            yield f"event: content_block_delta\ndata: {json.dumps({'type': 'content_block_delta', 'index': 0, 'delta': {'type': 'text_delta', 'text': text}})}\n\n"
+            yield _TEXT_DELTA_PREFIX + json_dumpb(text) + _DELTA_SUFFIX
 
-        tcs = delta.get("tool_calls", [])
+        tcs = delta.get("tool_calls") or _EMPTY_LIST
         for tc in tcs:
             if not in_tool:
-                yield f"event: content_block_stop\ndata: {json.dumps({'type': 'content_block_stop', 'index': 0})}\n\n"
+                yield _BLOCK_STOP_0
                 tool_index = 1
                 in_tool = True
-                func = tc.get("function", {})
-                yield f"event: content_block_start\ndata: {json.dumps({'type': 'content_block_start', 'index': tool_index, 'content_block': {'type': 'tool_use', 'id': tc.get('id', ''), 'name': func.get('name', ''), 'input': {}}})}\n\n"
-            func = tc.get("function", {})
+                func = tc.get("function") or _EMPTY
+                yield b"event: content_block_start\ndata: " + json_dumpb({"type": "content_block_start", "index": tool_index, "content_block": {"type": "tool_use", "id": tc.get("id", ""), "name": func.get("name", ""), "input": {}}}) + b"\n\n"
+            func = tc.get("function") or _EMPTY
             args = func.get("arguments", "")
             if args:
-                yield f"event: content_block_delta\ndata: {json.dumps({'type': 'content_block_delta', 'index': tool_index, 'delta': {'type': 'input_json_delta', 'partial_json': args}})}\n\n"
+                yield _TOOL_DELTA_PREFIX + json_dumpb(args) + _DELTA_SUFFIX
 
         if finish:
             stop_reason = "tool_use" if finish == "tool_calls" else "end_turn"
-            current_idx = tool_index if in_tool else 0
-            yield f"event: content_block_stop\ndata: {json.dumps({'type': 'content_block_stop', 'index': current_idx})}\n\n"
-            yield f"event: message_delta\ndata: {json.dumps({'type': 'message_delta', 'delta': {'stop_reason': stop_reason, 'stop_sequence': None}, 'usage': {'output_tokens': 0}})}\n\n"
-            yield f"event: message_stop\ndata: {json.dumps({'type': 'message_stop'})}\n\n"
+            yield _BLOCK_STOP_1 if in_tool else _BLOCK_STOP_0
+            yield b"event: message_delta\ndata: " + json_dumpb({"type": "message_delta", "delta": {"stop_reason": stop_reason, "stop_sequence": None}, "usage": {"output_tokens": 0}}) + b"\n\n"
+            yield _MESSAGE_STOP
 
 
 @router.post("/v1/messages")
 async def anthropic_messages(request: Request):
+    # Reject before buffering the body: no point reading a payload we refuse.
     anthropic_version = request.headers.get("anthropic-version")
     if not anthropic_version:
         raise HTTPException(400, "Missing required header: anthropic-version")
 
-    body = await request.json()
+    try:
+        body = json_loads(await request.body())
+    except Exception:
+        raise HTTPException(400, "Invalid JSON body")
     logger.info("[Anthropic Adapter] Received /v1/messages request for model: %s", body.get("model"))
     if not body.get("model"):
         raise HTTPException(400, "model is required")
@@ -217,13 +275,8 @@ async def anthropic_messages(request: Request):
         openai_resp = await execute_chat_completions(openai_req, request)
         if isinstance(openai_resp, StreamingResponse):
             model = body.get("model", "unknown")
-
-            async def _wrap():
-                async for chunk in _openai_sse_to_anthropic_sse(openai_resp.body_iterator, model):
-                    yield chunk
-
             return StreamingResponse(
-                _wrap(),
+                _openai_sse_to_anthropic_sse(openai_resp.body_iterator, model),
                 media_type="text/event-stream",
                 headers={"Cache-Control": "no-cache", "Connection": "keep-alive"},
             )
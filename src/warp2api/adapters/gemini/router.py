@@ -4,7 +4,6 @@ Converts Gemini generateContent requests into internal OpenAI chat completions.
 """
 from __future__ import annotations
 
-import json
 from typing import Any, Dict, List
 
 from fastapi import APIRouter, Request
@@ -13,16 +12,19 @@ from fastapi.responses import StreamingResponse
 from warp2api.adapters.common.logging import logger
 from warp2api.adapters.common.schemas import ChatCompletionsRequest, ChatMessage
 from warp2api.application.services.chat_gateway_service import execute_chat_completions
+from warp2api.infrastructure.utils.json import json_dumpb, json_loads
 
 router = APIRouter()
 
+# Shared empty-container sentinels: .get() defaults like {} / [{}] would
+# otherwise allocate a fresh object per call.
+_EMPTY: Dict[str, Any] = {}
+_EMPTY_LIST: List[Any] = []
+_NO_CHOICES: List[Dict[str, Any]] = [_EMPTY]
+
 
 def _gemini_parts_to_text(parts: List[Dict]) -> str:
-    texts = []
-    for part in parts:
-        if isinstance(part, dict) and "text" in part:
-            texts.append(part["text"])
-    return "\n".join(texts)
+    return "\n".join(part["text"] for part in parts if isinstance(part, dict) and "text" in part)
 
 
 def _gemini_role_to_openai(role: str) -> str:
@@ -35,24 +37,24 @@ def _convert_gemini_to_openai(body: Dict[str, Any], model: str) -> ChatCompletio
 
     sys_inst = body.get("systemInstruction") or body.get("system_instruction")
     if sys_inst:
-        parts = sys_inst.get("parts", [])
+        parts = sys_inst.get("parts") or _EMPTY_LIST
         text = _gemini_parts_to_text(parts) if parts else ""
         if text:
-            messages.append(ChatMessage(role="system", content=text))
+            messages.append(ChatMessage.model_construct(role="system", content=text))
 
-    for content in body.get("contents", []):
+    for content in body.get("contents") or _EMPTY_LIST:
         role = _gemini_role_to_openai(content.get("role", "user"))
-        parts = content.get("parts", [])
+        parts = content.get("parts") or _EMPTY_LIST
         text = _gemini_parts_to_text(parts)
         if text:
-            messages.append(ChatMessage(role=role, content=text))
+            messages.append(ChatMessage.model_construct(role=role, content=text))
 
-    return ChatCompletionsRequest(model=model, messages=messages, stream=body.get("stream", False))
+    return ChatCompletionsRequest.model_construct(model=model, messages=messages, stream=body.get("stream", False))
 
 
 def _openai_response_to_gemini(openai_resp: Dict[str, Any], model: str) -> Dict[str, Any]:
-    choice = openai_resp.get("choices", [{}])[0]
-    msg = choice.get("message", {})
+    choice = (openai_resp.get("choices") or _NO_CHOICES)[0]
+    msg = choice.get("message") or _EMPTY
     text = msg.get("content", "")
 
     return {
@@ -62,73 +64,78 @@ def _openai_response_to_gemini(openai_resp: Dict[str, Any], model: str) -> Dict[
     }
 
 
+# Constant frame pieces so the per-token loop only JSON-encodes the delta text.
+_CHUNK_PREFIX = b'data: {"candidates":[{"content":{"parts":[{"text":'
+_FINAL_FRAME = b'data: {"candidates":[{"content":{"parts":[{"text":""}],"role":"model"},"finishReason":"STOP"}]}\n\n'
+
+
 async def _openai_sse_to_gemini_sse(openai_stream, model: str):
+    chunk_suffix = b'}],"role":"model"},"index":0}],"modelVersion":' + json_dumpb(model) + b"}\n\n"
+
     async for chunk_line in openai_stream:
-        if not chunk_line.startswith("data: "):
+        # The gateway generator yields bytes frames; tolerate str for any
+        # other upstream.
+        if isinstance(chunk_line, str):
+            chunk_line = chunk_line.encode("utf-8")
+        if not chunk_line.startswith(b"data: "):
             continue
         payload = chunk_line[6:].strip()
-        if payload == "[DONE]":
-            final = {"candidates": [{"content": {"parts": [{"text": ""}], "role": "model"}, "finishReason": "STOP"}]}
-            yield f"data: {json.dumps(final)}\n\n"
+        if payload == b"[DONE]":
+            yield _FINAL_FRAME
             break
         try:
-            chunk = json.loads(payload)
+            chunk = json_loads(payload)
         except Exception:
             continue
 
-        delta = chunk.get("choices", [{}])[0].get("delta", {})
+        choices = chunk.get("choices")
+        delta = (choices[0] if choices else _EMPTY).get("delta") or _EMPTY
         text = delta.get("content", "")
         if text:
-            gemini_chunk = {
-                "candidates": [{"content": {"parts": [{"text": text}], "role": "model"}, "index": 0}],
-                "modelVersion": model,
-            }
-            yield f"data: {json.dumps(gemini_chunk)}\n\n"
+            yield _CHUNK_PREFIX + json_dumpb(text) + chunk_suffix
 
 
-@router.post("/v1/models/{model_name}:generateContent")
-async def gemini_generate(model_name: str, request: Request):
-    body = await request.json()
-    logger.info("[Gemini Adapter] Received generateContent for model: %s", model_name)
+async def _gemini_impl(model_name: str, request: Request, stream: bool):
+    # Shared core for the v1 and v1beta routes: read + convert + execute once.
+    body = json_loads(await request.body())
+    if stream:
+        body["stream"] = True
+    logger.info(
+        "[Gemini Adapter] Received %s for model: %s",
+        "streamGenerateContent" if stream else "generateContent",
+        model_name,
+    )
 
     openai_req = _convert_gemini_to_openai(body, model_name)
     openai_resp = await execute_chat_completions(openai_req, request)
 
+    if stream and isinstance(openai_resp, StreamingResponse):
+        return StreamingResponse(
+            _openai_sse_to_gemini_sse(openai_resp.body_iterator, model_name),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "Connection": "keep-alive"},
+        )
+
     if isinstance(openai_resp, dict):
         return _openai_response_to_gemini(openai_resp, model_name)
     return openai_resp
 
 
+@router.post("/v1/models/{model_name}:generateContent")
+async def gemini_generate(model_name: str, request: Request):
+    return await _gemini_impl(model_name, request, stream=False)
+
+
 @router.post("/v1beta/models/{model_name}:generateContent")
 async def gemini_generate_v1beta(model_name: str, request: Request):
-    return await gemini_generate(model_name, request)
+    return await _gemini_impl(model_name, request, stream=False)
 
 
 @router.post("/v1/models/{model_name}:streamGenerateContent")
 async def gemini_stream_generate(model_name: str, request: Request):
-    body = await request.json()
-    body["stream"] = True
-    logger.info("[Gemini Adapter] Received streamGenerateContent for model: %s", model_name)
-
-    openai_req = _convert_gemini_to_openai(body, model_name)
-    openai_resp = await execute_chat_completions(openai_req, request)
-
-    if isinstance(openai_resp, StreamingResponse):
-        async def _wrap():
-            async for chunk in _openai_sse_to_gemini_sse(openai_resp.body_iterator, model_name):
-                yield chunk
-
-        return StreamingResponse(
-            _wrap(),
-            media_type="text/event-stream",
-            headers={"Cache-Control": "no-cache", "Connection": "keep-alive"},
-        )
-
-    if isinstance(openai_resp, dict):
-        return _openai_response_to_gemini(openai_resp, model_name)
-    return openai_resp
+    return await _gemini_impl(model_name, request, stream=True)
 
 
 @router.post("/v1beta/models/{model_name}:streamGenerateContent")
 async def gemini_stream_generate_v1beta(model_name: str, request: Request):
-    return await gemini_stream_generate(model_name, request)
+    return await _gemini_impl(model_name, request, stream=True)
@@ -5,28 +5,18 @@ import asyncio
 from pathlib import Path
 
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import ORJSONResponse
 
-from warp2api.adapters.anthropic.router import router as anthropic_router
-from warp2api.adapters.gemini.router import router as gemini_router
 from warp2api.adapters.common.logging import logger
-from warp2api.api.routes.auth_routes import router as auth_router
-from warp2api.api.routes.codec_routes import router as codec_router
-from warp2api.api.routes.admin_token_routes import router as admin_token_router
-from warp2api.api.routes.model_routes import router as model_router
-from warp2api.api.routes.warp_chat_routes import router as warp_chat_router
-from warp2api.api.routes.warp_send_routes import router as warp_send_router
-from warp2api.api.routes.warp_token_routes import router as warp_token_router
-from warp2api.api.routes.ws_routes import router as ws_router
-from warp2api.api.runtime import manager
-from warp2api.application.services.gateway_access import initialize_once
-from warp2api.app.gateway_bootstrap import shutdown_tasks, startup_tasks
-from warp2api.infrastructure.runtime.stream_processor import set_websocket_manager
-from .router import router
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    from warp2api.api.runtime import manager
+    from warp2api.application.services.gateway_access import initialize_once
+    from warp2api.app.gateway_bootstrap import shutdown_tasks, startup_tasks
+    from warp2api.infrastructure.runtime.stream_processor import set_websocket_manager
+
     try:
         logger.info("[OpenAI Compat] Server starting in unified mode (no bridge relay)")
         logger.info(
@@ -40,32 +30,78 @@ async def lifespan(app: FastAPI):
     set_websocket_manager(manager)
     await startup_tasks()
 
-    try:
-        await initialize_once()
-    except Exception as e:
-        logger.warning("[OpenAI Compat] Warmup initialize_once on startup failed: %s", e)
+    # Warm up in the background so server readiness isn't gated on the bridge;
+    # request handlers still await initialize_once() themselves. Running the
+    # JWT refresh here keeps it on the serving loop instead of a throwaway
+    # asyncio.run() before the port opens.
+    async def _warmup() -> None:
+        try:
+            from warp2api.infrastructure.auth.jwt_auth import refresh_jwt_if_needed
+
+            await refresh_jwt_if_needed()
+        except Exception as e:
+            logger.warning("[OpenAI Compat] JWT refresh on startup failed: %s", e)
+        try:
+            await initialize_once()
+        except Exception as e:
+            logger.warning("[OpenAI Compat] Warmup initialize_once on startup failed: %s", e)
+
+    warmup_task = asyncio.create_task(_warmup())
     try:
         yield
     finally:
+        warmup_task.cancel()
         try:
             await shutdown_tasks()
         except asyncio.CancelledError:
             pass
 
 
-app = FastAPI(title="warp2api Multi-Protocol Gateway", lifespan=lifespan)
-app.include_router(router)
-app.include_router(anthropic_router)
-app.include_router(gemini_router)
-app.include_router(codec_router)
-app.include_router(auth_router)
-app.include_router(admin_token_router)
-app.include_router(model_router)
-app.include_router(warp_chat_router)
-app.include_router(warp_send_router)
-app.include_router(warp_token_router)
-app.include_router(ws_router)
-
-_static_dir = Path("static")
-if _static_dir.exists():
-    app.mount("/assets", StaticFiles(directory="static"), name="assets")
+def _build_app() -> FastAPI:
+    # Router imports are deferred to here so that importing this module (e.g.
+    # transitively from CLI scripts) does not pull every route's dependency
+    # graph at process start.
+    from warp2api.adapters.anthropic.router import router as anthropic_router
+    from warp2api.adapters.gemini.router import router as gemini_router
+    from warp2api.api.routes.auth_routes import router as auth_router
+    from warp2api.api.routes.codec_routes import router as codec_router
+    from warp2api.api.routes.admin_token_routes import router as admin_token_router
+    from warp2api.api.routes.model_routes import router as model_router
+    from warp2api.api.routes.warp_chat_routes import router as warp_chat_router
+    from warp2api.api.routes.warp_send_routes import router as warp_send_router
+    from warp2api.api.routes.warp_token_routes import router as warp_token_router
+    from warp2api.api.routes.ws_routes import router as ws_router
+    from .router import router
+
+    from fastapi.staticfiles import StaticFiles
+
+    app = FastAPI(
+        title="warp2api Multi-Protocol Gateway",
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
+    )
+    app.include_router(router)
+    app.include_router(anthropic_router)
+    app.include_router(gemini_router)
+    app.include_router(codec_router)
+    app.include_router(auth_router)
+    app.include_router(admin_token_router)
+    app.include_router(model_router)
+    app.include_router(warp_chat_router)
+    app.include_router(warp_send_router)
+    app.include_router(warp_token_router)
+    app.include_router(ws_router)
+
+    static_dir = Path("static")
+    if static_dir.exists():
+        app.mount("/assets", StaticFiles(directory="static"), name="assets")
+    return app
+
+
+def __getattr__(name: str) -> FastAPI:
+    # PEP 562: build the app (and import all routers) only on first access.
+    if name == "app":
+        app = _build_app()
+        globals()["app"] = app
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,15 +1,17 @@
 from __future__ import annotations
 
-import json
+import time
 from datetime import datetime, timezone
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, HTTPException, Request, Response
 from fastapi.responses import StreamingResponse
 
-from warp2api.adapters.common.schemas import ChatCompletionsRequest
+from warp2api.adapters.common.schemas import ChatCompletionsRequest, ChatMessage
 from warp2api.application.services.gateway_access import authenticate_request
 from warp2api.application.services.chat_gateway_service import execute_chat_completions
 from warp2api.application.services.token_pool_service import get_token_pool_service
+from warp2api.infrastructure.utils.json import json_dumpb, json_loads
 from warp2api.application.services.openai_protocol_service import (
+    coalesce_stream,
     completion_to_responses_payload,
     extract_responses_input_text,
     fetch_models,
@@ -19,15 +21,40 @@ from warp2api.application.services.openai_protocol_service import (
 
 router = APIRouter()
 
+# X-Accel-Buffering tells nginx-style reverse proxies not to buffer the
+# event stream; buffering would defeat token-by-token delivery.
+_SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",
+}
+
 
 def _to_openai_model_list(payload):
     # compatibility wrapper for tests/imports
     return to_openai_model_list(payload)
 
 
+# The root payload never changes; serve pre-encoded bytes.
+_ROOT_BYTES = json_dumpb({"service": "warp2api Multi-Protocol Gateway", "status": "ok"})
+
+
 @router.get("/")
 def root():
-    return {"service": "warp2api Multi-Protocol Gateway", "status": "ok"}
+    return Response(_ROOT_BYTES, media_type="application/json")
+
+
+# ISO formatting per probe adds up under LB storms; 250ms granularity is
+# plenty for a health timestamp.
+_TS = {"t": 0.0, "s": ""}
+
+
+def _cached_utc_iso() -> str:
+    now = time.time()
+    if now - _TS["t"] > 0.25:
+        _TS["s"] = datetime.fromtimestamp(now, tz=timezone.utc).isoformat()
+        _TS["t"] = now
+    return _TS["s"]
 
 
 @router.get("/healthz")
@@ -37,7 +64,7 @@ async def health_check():
     return {
         "status": "ok",
         "service": "warp2api Multi-Protocol Gateway",
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": _cached_utc_iso(),
         "streaming": {
             "openai_chat_completions": True,
             "openai_responses": True,
@@ -55,14 +82,39 @@ async def list_models():
 
 @router.post("/v1/chat/completions")
 async def chat_completions(req: ChatCompletionsRequest, request: Request = None):
+    # Cheap rejections first: a malformed request should not cost a bridge
+    # initialization or a token-pool acquisition.
+    if not req.messages:
+        raise HTTPException(400, "messages 不能为空")
+    readiness = get_token_pool_service().readiness()
+    if not readiness.get("ready") and int(readiness.get("total_tokens") or 0) > 0:
+        # Pool has accounts but none currently usable — shed load instead of
+        # hammering upstream. An empty pool is left to the anonymous-account
+        # bootstrap in the normal path.
+        retry_after = int(readiness.get("soonest_recovery_seconds") or 5)
+        raise HTTPException(
+            503,
+            "token pool not ready",
+            headers={"Retry-After": str(max(1, retry_after))},
+        )
     return await execute_chat_completions(req, request)
 
 
 @router.post("/v1/responses")
 async def responses_api(request: Request):
     await authenticate_request(request)
-    body = await request.json()
+    # Read the body once and parse bytes directly; request.json() would
+    # decode to str first and use stdlib json.
+    raw = await request.body()
+    try:
+        body = json_loads(raw) if raw else {}
+    except Exception:
+        raise HTTPException(400, "invalid JSON body")
+    if not isinstance(body, dict):
+        raise HTTPException(400, "invalid JSON body")
     model = body.get("model")
+    if model is not None:
+        model = str(model)
     inp = body.get("input")
     stream = bool(body.get("stream", False))
 
@@ -70,9 +122,11 @@ async def responses_api(request: Request):
     if not text:
         raise HTTPException(400, "input is required")
 
-    chat_req = ChatCompletionsRequest(
+    # model_construct skips pydantic validation; safe here because the shape
+    # is fixed and text/model/stream were normalized above.
+    chat_req = ChatCompletionsRequest.model_construct(
         model=model,
-        messages=[{"role": "user", "content": text}],
+        messages=[ChatMessage.model_construct(role="user", content=text)],
         stream=stream,
     )
 
@@ -82,13 +136,13 @@ async def responses_api(request: Request):
         if not isinstance(chat_stream, StreamingResponse):
             payload = completion_to_responses_payload(chat_stream, model or "warp-default")
             async def _single():
-                yield f"event: response.completed\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
-            return StreamingResponse(_single(), media_type="text/event-stream")
+                yield b"event: response.completed\ndata: " + json_dumpb(payload) + b"\n\n"
+            return StreamingResponse(_single(), media_type="text/event-stream", headers=_SSE_HEADERS)
 
         return StreamingResponse(
-            stream_chat_to_responses(chat_stream, model or "warp-default"),
+            coalesce_stream(stream_chat_to_responses(chat_stream, model or "warp-default")),
             media_type="text/event-stream",
-            headers={"Cache-Control": "no-cache", "Connection": "keep-alive"},
+            headers=_SSE_HEADERS,
         )
 
     completion = await chat_completions(chat_req, request)
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import hmac
+
 from fastapi import HTTPException, Request, status
 
 from warp2api.infrastructure.settings.settings import get_admin_auth_mode, get_admin_token
 
+_VALID_MODES = frozenset({"off", "local", "token"})
+_LOCAL_HOSTS = frozenset({"127.0.0.1", "::1", "localhost", "testclient"})
+
 
 def _get_admin_token() -> str:
     return get_admin_token()
@@ -11,19 +16,15 @@ def _get_admin_token() -> str:
 
 def _auth_mode() -> str:
     mode = get_admin_auth_mode()
-    if mode in {"off", "local", "token"}:
+    if mode in _VALID_MODES:
         return mode
     return "token"
 
 
 def _is_local_request(request: Request) -> bool:
-    host = ""
-    try:
-        if request.client and request.client.host:
-            host = str(request.client.host)
-    except Exception:
-        host = ""
-    return host in {"127.0.0.1", "::1", "localhost", "testclient"}
+    client = request.client
+    host = getattr(client, "host", "") if client else ""
+    return host in _LOCAL_HOSTS
 
 
 async def require_admin_auth(request: Request) -> None:
@@ -47,7 +48,25 @@ async def require_admin_auth(request: Request) -> None:
     if auth.startswith("Bearer "):
         bearer = auth[7:].strip()
 
-    if bearer == expected or x_admin == expected:
+    # Unauthenticated probes mostly send nothing or garbage; reject those on
+    # length before the constant-time compares, which deliberately run to
+    # completion. compare_digest already leaks length, so this gives nothing
+    # new away.
+    exp_len = len(expected)
+    if (not bearer or len(bearer) != exp_len) and (not x_admin or len(x_admin) != exp_len):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid admin token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    # Constant-time compares so the token can't be probed byte by byte.
+    # Bytes operands: compare_digest raises TypeError on non-ASCII str, and
+    # header values arrive latin-1 decoded.
+    expected_b = expected.encode("utf-8")
+    if hmac.compare_digest(bearer.encode("utf-8"), expected_b) or hmac.compare_digest(
+        x_admin.encode("utf-8"), expected_b
+    ):
         return
 
     raise HTTPException(
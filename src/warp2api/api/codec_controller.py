@@ -6,7 +6,12 @@ Codec controller for protobuf encode/decode endpoints.
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import binascii
+import concurrent.futures
+import functools
+import os
 from typing import Any, Awaitable, Callable, Dict
 
 from fastapi import HTTPException
@@ -20,23 +25,40 @@ from .schemas import EncodeRequest, DecodeRequest, StreamDecodeRequest
 
 LogPacketFn = Callable[[str, Dict[str, Any], int], Awaitable[None]]
 
+# Protobuf (de)serialization is CPU-bound and can take milliseconds on multi-KB
+# packets; run it off the event loop so concurrent requests are not stalled.
+_CODEC_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 4, thread_name_prefix="codec"
+)
 
-async def encode_request_payload(request: EncodeRequest, log_packet: LogPacketFn) -> Dict[str, Any]:
+
+async def _in_codec_executor(fn: Callable[..., Any], *args: Any) -> Any:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_CODEC_EXECUTOR, fn, *args)
+
+
+async def encode_request_raw(request: EncodeRequest, log_packet: LogPacketFn) -> bytes:
+    """Encode to raw protobuf bytes (no base64), shared by both response paths."""
     actual_data = request.get_data()
     if not actual_data:
         raise HTTPException(400, "数据包不能为空")
 
-    wrapped = {"json_data": actual_data}
-    wrapped = sanitize_mcp_input_schema_in_packet(wrapped)
-    actual_data = wrapped.get("json_data", actual_data)
+    # The sanitizer accepts the packet root directly; the or-fallback keeps
+    # the old behavior of preserving the input when everything cleans away.
+    actual_data = sanitize_mcp_input_schema_in_packet(actual_data) or actual_data
     actual_data = encode_smd_inplace(actual_data)
-    protobuf_bytes = dict_to_protobuf_bytes(actual_data, request.message_type)
+    protobuf_bytes = await _in_codec_executor(dict_to_protobuf_bytes, actual_data, request.message_type)
 
     try:
         await log_packet("encode", actual_data, len(protobuf_bytes))
     except Exception as log_error:
         logger.warning(f"数据包记录失败: {log_error}")
 
+    return protobuf_bytes
+
+
+async def encode_request_payload(request: EncodeRequest, log_packet: LogPacketFn) -> Dict[str, Any]:
+    protobuf_bytes = await encode_request_raw(request, log_packet)
     return {
         "protobuf_bytes": base64.b64encode(protobuf_bytes).decode("utf-8"),
         "size": len(protobuf_bytes),
@@ -57,7 +79,7 @@ async def decode_request_payload(request: DecodeRequest, log_packet: LogPacketFn
     if not protobuf_bytes:
         raise HTTPException(400, "解码后的protobuf数据为空")
 
-    json_data = protobuf_to_dict(protobuf_bytes, request.message_type)
+    json_data = await _in_codec_executor(protobuf_to_dict, protobuf_bytes, request.message_type)
     try:
         await log_packet("decode", json_data, len(protobuf_bytes))
     except Exception as log_error:
@@ -68,12 +90,16 @@ async def decode_request_payload(request: DecodeRequest, log_packet: LogPacketFn
 
 async def decode_stream_payload(request: StreamDecodeRequest, log_packet: LogPacketFn) -> Dict[str, Any]:
     results = []
+    raw_chunks = []
     total_size = 0
 
     for i, chunk_b64 in enumerate(request.protobuf_chunks):
         try:
-            chunk_bytes = base64.b64decode(chunk_b64)
-            chunk_json = protobuf_to_dict(chunk_bytes, request.message_type)
+            # binascii.a2b_base64 skips base64.b64decode's wrapper/validation
+            # layer; per-chunk sizes are needed, so decode chunk by chunk.
+            chunk_bytes = binascii.a2b_base64(chunk_b64)
+            raw_chunks.append(chunk_bytes)
+            chunk_json = await _in_codec_executor(protobuf_to_dict, chunk_bytes, request.message_type)
             chunk_result = {
                 "chunk_index": i,
                 "json_data": chunk_json,
@@ -84,11 +110,14 @@ async def decode_stream_payload(request: StreamDecodeRequest, log_packet: LogPac
             await log_packet(f"stream_decode_chunk_{i}", chunk_json, len(chunk_bytes))
         except Exception as e:
             logger.warning(f"数据块 {i} 解码失败: {e}")
+            if len(raw_chunks) == i:  # base64 decode itself failed
+                raw_chunks.append(b"")
             results.append({"chunk_index": i, "error": str(e), "size": 0})
 
     try:
-        all_bytes = b"".join([base64.b64decode(chunk) for chunk in request.protobuf_chunks])
-        complete_json = protobuf_to_dict(all_bytes, request.message_type)
+        # Reuse the bytes decoded in the loop instead of base64-decoding twice.
+        all_bytes = b"".join(raw_chunks)
+        complete_json = await _in_codec_executor(protobuf_to_dict, all_bytes, request.message_type)
         await log_packet("stream_decode_complete", complete_json, len(all_bytes))
         complete_result = {"json_data": complete_json, "size": len(all_bytes)}
     except Exception as e:
@@ -104,9 +133,18 @@ async def decode_stream_payload(request: StreamDecodeRequest, log_packet: LogPac
 
 
 def get_schemas_payload() -> Dict[str, Any]:
-    from warp2api.infrastructure.protobuf.runtime import ensure_proto_runtime, ALL_MSGS, msg_cls
+    from warp2api.infrastructure.protobuf.runtime import ensure_proto_runtime, runtime_version
 
     ensure_proto_runtime()
+    return _build_schemas_payload(runtime_version())
+
+
+@functools.lru_cache(maxsize=4)
+def _build_schemas_payload(version: int) -> Dict[str, Any]:
+    # Keyed by runtime_version(): the schema set only changes when the
+    # descriptor pool reloads, so the descriptor walk runs once per load.
+    from warp2api.infrastructure.protobuf.runtime import ALL_MSGS, msg_cls
+
     schemas = []
     for msg_name in ALL_MSGS:
         try:
@@ -3,9 +3,9 @@ from __future__ import annotations
 from pathlib import Path
 from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from pydantic import BaseModel, Field
-from fastapi.responses import HTMLResponse
+from fastapi.responses import FileResponse, HTMLResponse
 
 from warp2api.api.admin_auth import require_admin_auth
 from warp2api.application.services.token_pool_service import get_token_pool_service
@@ -13,6 +13,10 @@ from warp2api.application.services.token_pool_service import get_token_pool_serv
 router = APIRouter()
 ADMIN_API_PREFIX = "/admin/api/tokens"
 
+# The admin API routes share one router-level auth dependency instead of an
+# explicit await in every handler; the HTML page below stays unauthenticated.
+admin_api = APIRouter(prefix=ADMIN_API_PREFIX, dependencies=[Depends(require_admin_auth)])
+
 
 class BatchImportRequest(BaseModel):
     tokens: List[str] = Field(default_factory=list)
@@ -44,28 +48,28 @@ async def admin_tokens_page():
     file_path = Path("static") / "admin-tokens.html"
     if not file_path.exists():
         return HTMLResponse("admin-tokens.html not found", status_code=404)
-    return HTMLResponse(file_path.read_text(encoding="utf-8"))
+    # FileResponse streams from disk (sendfile where available) and carries
+    # ETag/Last-Modified so browsers can revalidate with 304s, instead of a
+    # read+decode+re-encode per hit.
+    return FileResponse(file_path, media_type="text/html")
 
 
-@router.get(f"{ADMIN_API_PREFIX}")
-async def admin_list_tokens(request: Request):
-    await require_admin_auth(request)
+@admin_api.get("")
+async def admin_list_tokens():
     svc = get_token_pool_service()
     return {"success": True, "data": svc.list_tokens()}
 
 
-@router.post(f"{ADMIN_API_PREFIX}")
+@admin_api.post("")
 async def admin_add_token(payload: AddTokenRequest, request: Request):
-    await require_admin_auth(request)
     svc = get_token_pool_service()
     actor = request.headers.get("x-admin-actor") or "admin"
     result = await svc.batch_import_and_hydrate([payload.token], actor=actor)
     return {"success": True, "data": result}
 
 
-@router.post(f"{ADMIN_API_PREFIX}/batch-import")
+@admin_api.post("/batch-import")
 async def admin_batch_import_tokens(payload: BatchImportRequest, request: Request):
-    await require_admin_auth(request)
     svc = get_token_pool_service()
     actor = request.headers.get("x-admin-actor") or "admin"
     raw_accounts = []
@@ -82,18 +86,16 @@ async def admin_batch_import_tokens(payload: BatchImportRequest, request: Reques
     return {"success": True, "data": result}
 
 
-@router.post(f"{ADMIN_API_PREFIX}/batch-delete")
+@admin_api.post("/batch-delete")
 async def admin_batch_delete_tokens(payload: BatchDeleteRequest, request: Request):
-    await require_admin_auth(request)
     svc = get_token_pool_service()
     actor = request.headers.get("x-admin-actor") or "admin"
     result = svc.batch_delete_tokens(payload.ids, actor=actor)
     return {"success": True, "data": result}
 
 
-@router.patch(f"{ADMIN_API_PREFIX}" + "/{token_id}")
+@admin_api.patch("/{token_id}")
 async def admin_update_token(token_id: int, payload: UpdateTokenRequest, request: Request):
-    await require_admin_auth(request)
     svc = get_token_pool_service()
     actor = request.headers.get("x-admin-actor") or "admin"
     try:
@@ -103,9 +105,8 @@ async def admin_update_token(token_id: int, payload: UpdateTokenRequest, request
     return {"success": True, "data": data}
 
 
-@router.delete(f"{ADMIN_API_PREFIX}" + "/{token_id}")
+@admin_api.delete("/{token_id}")
 async def admin_delete_token(token_id: int, request: Request):
-    await require_admin_auth(request)
     svc = get_token_pool_service()
     actor = request.headers.get("x-admin-actor") or "admin"
     try:
@@ -115,9 +116,8 @@ async def admin_delete_token(token_id: int, request: Request):
     return {"success": True, "data": data}
 
 
-@router.post(f"{ADMIN_API_PREFIX}" + "/{token_id}/refresh")
+@admin_api.post("/{token_id}/refresh")
 async def admin_refresh_token(token_id: int, request: Request):
-    await require_admin_auth(request)
     svc = get_token_pool_service()
     actor = request.headers.get("x-admin-actor") or "admin"
     try:
@@ -127,9 +127,8 @@ async def admin_refresh_token(token_id: int, request: Request):
     return {"success": True, "data": result}
 
 
-@router.post(f"{ADMIN_API_PREFIX}" + "/{token_id}/health-check")
+@admin_api.post("/{token_id}/health-check")
 async def admin_health_check_token(token_id: int, request: Request):
-    await require_admin_auth(request)
     svc = get_token_pool_service()
     actor = request.headers.get("x-admin-actor") or "admin"
     try:
@@ -139,9 +138,8 @@ async def admin_health_check_token(token_id: int, request: Request):
     return {"success": True, "data": result}
 
 
-@router.post(f"{ADMIN_API_PREFIX}" + "/{token_id}/quota-refresh")
+@admin_api.post("/{token_id}/quota-refresh")
 async def admin_refresh_token_quota(token_id: int, request: Request):
-    await require_admin_auth(request)
     svc = get_token_pool_service()
     actor = request.headers.get("x-admin-actor") or "admin"
     try:
@@ -151,48 +149,45 @@ async def admin_refresh_token_quota(token_id: int, request: Request):
     return {"success": True, "data": result}
 
 
-@router.post(f"{ADMIN_API_PREFIX}/refresh-all")
+@admin_api.post("/refresh-all")
 async def admin_refresh_all_tokens(request: Request):
-    await require_admin_auth(request)
     svc = get_token_pool_service()
     actor = request.headers.get("x-admin-actor") or "admin"
     result = await svc.refresh_all(actor=actor)
     return {"success": True, "data": result}
 
 
-@router.get(f"{ADMIN_API_PREFIX}/statistics")
-async def admin_tokens_statistics(request: Request):
-    await require_admin_auth(request)
+@admin_api.get("/statistics")
+async def admin_tokens_statistics():
     svc = get_token_pool_service()
     return {"success": True, "data": svc.statistics()}
 
 
-@router.get(f"{ADMIN_API_PREFIX}/events")
-async def admin_tokens_events(request: Request, limit: int = Query(100, ge=1, le=500)):
-    await require_admin_auth(request)
+@admin_api.get("/events")
+async def admin_tokens_events(limit: int = Query(100, ge=1, le=500)):
     svc = get_token_pool_service()
     return {"success": True, "data": svc.events(limit=limit)}
 
 
-@router.get(f"{ADMIN_API_PREFIX}/health")
-async def admin_tokens_health(request: Request):
-    await require_admin_auth(request)
+@admin_api.get("/health")
+async def admin_tokens_health():
     svc = get_token_pool_service()
     return {"success": True, "data": svc.health()}
 
 
-@router.get(f"{ADMIN_API_PREFIX}/readiness")
-async def admin_tokens_readiness(request: Request):
-    await require_admin_auth(request)
+@admin_api.get("/readiness")
+async def admin_tokens_readiness():
     svc = get_token_pool_service()
     return {"success": True, "data": svc.readiness()}
 
 
-@router.get(f"{ADMIN_API_PREFIX}" + "/{token_id}")
-async def admin_get_token(token_id: int, request: Request):
-    await require_admin_auth(request)
+@admin_api.get("/{token_id}")
+async def admin_get_token(token_id: int):
     svc = get_token_pool_service()
     token = svc.get_token(token_id)
     if not token:
         raise HTTPException(404, "token not found")
     return {"success": True, "data": token}
+
+
+router.include_router(admin_api)
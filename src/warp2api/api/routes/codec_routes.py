@@ -3,13 +3,16 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException
+from itertools import islice
+
+from fastapi import APIRouter, HTTPException, Request, Response
 
 from warp2api.observability.logging import logger
 from ..codec_controller import (
     decode_request_payload,
     decode_stream_payload,
     encode_request_payload,
+    encode_request_raw,
     get_schemas_payload,
 )
 from ..runtime import manager
@@ -19,9 +22,22 @@ router = APIRouter()
 
 
 @router.post("/api/encode")
-async def encode_json_to_protobuf(request: EncodeRequest):
+async def encode_json_to_protobuf(request: EncodeRequest, http_request: Request):
     try:
         logger.info(f"收到编码请求，消息类型: {request.message_type}")
+        # Binary fast path: callers that accept octet-stream skip the ~4/3x
+        # base64 expansion entirely.
+        if http_request.headers.get("accept") == "application/octet-stream":
+            protobuf_bytes = await encode_request_raw(request, manager.log_packet)
+            logger.info(f"✅ JSON编码为protobuf成功: {len(protobuf_bytes)} 字节 (binary)")
+            return Response(
+                content=protobuf_bytes,
+                media_type="application/octet-stream",
+                headers={
+                    "X-Message-Type": request.message_type,
+                    "X-Size": str(len(protobuf_bytes)),
+                },
+            )
         result = await encode_request_payload(request, manager.log_packet)
         logger.info(f"✅ JSON编码为protobuf成功: {result['size']} 字节")
         return result
@@ -74,8 +90,9 @@ async def get_protobuf_schemas():
 @router.get("/api/packets/history")
 async def get_packet_history(limit: int = 50):
     try:
-        history = manager.packet_history[-limit:] if len(manager.packet_history) > limit else manager.packet_history
-        return {"packets": history, "total_count": len(manager.packet_history), "returned_count": len(history)}
+        total = len(manager.packet_history)
+        history = list(islice(manager.packet_history, max(0, total - limit), None))
+        return {"packets": history, "total_count": total, "returned_count": len(history)}
     except Exception as e:
         logger.error(f"❌ 获取数据包历史失败: {e}")
         raise HTTPException(500, f"获取历史记录失败: {e}")
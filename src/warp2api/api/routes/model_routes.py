@@ -28,13 +28,10 @@ async def get_warp_models_endpoint():
 async def get_warp_models_openai_endpoint():
     try:
         models = get_all_unique_models()
+        # One timestamp for the whole listing instead of one clock read per model.
+        created = int(datetime.now().timestamp())
         data = [
-            {
-                "id": m["id"],
-                "object": "model",
-                "created": int(datetime.now().timestamp()),
-                "owned_by": "warp",
-            }
+            {"id": m["id"], "object": "model", "created": created, "owned_by": "warp"}
             for m in models
         ]
         return {"object": "list", "data": data}
@@ -3,8 +3,10 @@
 
 from __future__ import annotations
 
-import json
-from typing import Dict
+import asyncio
+import uuid
+from collections import Counter
+from typing import Any, Dict
 
 from fastapi import APIRouter, HTTPException, Query
 from fastapi.responses import StreamingResponse
@@ -14,16 +16,25 @@ from warp2api.observability.logging import logger
 from ..runtime import manager
 from ..schemas import EncodeRequest
 from warp2api.application.services.warp_request_service import execute_warp_packet
+from warp2api.infrastructure.utils.json import json_dumpb
 
 router = APIRouter()
 
+# Proxy-compatible SSE headers; X-Accel-Buffering stops nginx-style proxies
+# from buffering the stream.
+_SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",
+}
+
 
 async def _execute_and_format_warp_response(
     request: EncodeRequest,
+    actual_data: Dict,
     log_prefix: str,
     include_events: bool,
 ) -> Dict:
-    actual_data = request.get_data()
     if not actual_data:
         raise HTTPException(400, "数据包不能为空")
 
@@ -55,7 +66,11 @@ async def _execute_and_format_warp_response(
     }
     if include_events:
         response_data["parsed_events"] = parsed_events
-    await manager.log_packet(f"warp_response{log_prefix}", response_data, len(str(response_data)))
+    # str(response_data) would build (and throw away) a full repr that can
+    # reach megabytes with events; size the JSON encoding instead, and only
+    # when a websocket subscriber will actually see it.
+    response_size = len(json_dumpb(response_data)) if manager.active_connections else 0
+    await manager.log_packet(f"warp_response{log_prefix}", response_data, response_size)
 
     result = {
         "response": response_text,
@@ -71,11 +86,9 @@ async def _execute_and_format_warp_response(
     if include_events:
         result["parsed_events"] = parsed_events
         result["events_count"] = len(parsed_events)
-        event_type_counts: Dict[str, int] = {}
-        for event in parsed_events:
-            event_type = event.get("event_type", "UNKNOWN")
-            event_type_counts[event_type] = event_type_counts.get(event_type, 0) + 1
-        result["events_summary"] = event_type_counts
+        result["events_summary"] = dict(
+            Counter(event.get("event_type", "UNKNOWN") for event in parsed_events)
+        )
     return result
 
 
@@ -85,45 +98,50 @@ async def send_to_warp_api(
     show_all_events: bool = Query(True, description="Show detailed SSE event breakdown"),
 ):
     _ = show_all_events
+    # get_data() rebuilds the packet dict; compute it once and reuse it in
+    # the error handler instead of paying for it twice on failures.
+    actual_data = request.get_data()
     try:
         logger.info(f"收到Warp API发送请求，消息类型: {request.message_type}")
         result = await _execute_and_format_warp_response(
             request=request,
+            actual_data=actual_data,
             log_prefix="",
             include_events=False,
         )
         logger.info(f"✅ Warp API调用成功，响应长度: {result['response_size']} 字符")
         return result
     except Exception as e:
-        import traceback
-
-        actual_data = request.get_data()
+        # Traceback formatting happens lazily inside the logging handler;
+        # clients get an error id to correlate with the log line.
+        err_id = uuid.uuid4().hex[:8]
         error_details = {
+            "error_id": err_id,
             "error": str(e),
             "error_type": type(e).__name__,
-            "traceback": traceback.format_exc(),
             "request_info": {
                 "message_type": request.message_type,
-                "json_size": len(str(actual_data)),
                 "has_tools": "mcp_context" in actual_data,
                 "has_history": "task_context" in actual_data,
             },
         }
-        logger.error(f"❌ Warp API调用失败: {e}")
-        logger.error(f"错误详情: {error_details}")
-        try:
-            await manager.log_packet("warp_error", error_details, 0)
-        except Exception as log_error:
-            logger.warning(f"记录错误失败: {log_error}")
+        logger.exception(f"❌ Warp API调用失败 [{err_id}]: {e}")
+        if manager.active_connections:
+            try:
+                await manager.log_packet("warp_error", error_details, 0)
+            except Exception as log_error:
+                logger.warning(f"记录错误失败: {log_error}")
         raise HTTPException(500, detail=error_details)
 
 
 @router.post("/api/warp/send_stream")
 async def send_to_warp_api_parsed(request: EncodeRequest):
+    actual_data = request.get_data()
     try:
         logger.info(f"收到Warp API解析发送请求，消息类型: {request.message_type}")
         result = await _execute_and_format_warp_response(
             request=request,
+            actual_data=actual_data,
             log_prefix="_parsed",
             include_events=True,
         )
@@ -132,26 +150,23 @@ async def send_to_warp_api_parsed(request: EncodeRequest):
         )
         return result
     except Exception as e:
-        import traceback
-
-        actual_data = request.get_data()
+        err_id = uuid.uuid4().hex[:8]
         error_details = {
+            "error_id": err_id,
             "error": str(e),
             "error_type": type(e).__name__,
-            "traceback": traceback.format_exc(),
             "request_info": {
                 "message_type": request.message_type,
-                "json_size": len(str(actual_data)),
                 "has_tools": "mcp_context" in (actual_data or {}),
                 "has_history": "task_context" in (actual_data or {}),
             },
         }
-        logger.error(f"❌ Warp API解析调用失败: {e}")
-        logger.error(f"错误详情: {error_details}")
-        try:
-            await manager.log_packet("warp_error_parsed", error_details, 0)
-        except Exception as log_error:
-            logger.warning(f"记录错误失败: {log_error}")
+        logger.exception(f"❌ Warp API解析调用失败 [{err_id}]: {e}")
+        if manager.active_connections:
+            try:
+                await manager.log_packet("warp_error_parsed", error_details, 0)
+            except Exception as log_error:
+                logger.warning(f"记录错误失败: {log_error}")
         raise HTTPException(500, detail=error_details)
 
 
@@ -161,42 +176,64 @@ async def send_to_warp_api_stream_sse(request: EncodeRequest):
         actual_data = request.get_data()
         if not actual_data:
             raise HTTPException(400, "数据包不能为空")
-        exec_ctx = await execute_warp_packet(
-            actual_data=actual_data,
-            message_type=request.message_type,
-            timeout_seconds=90,
-            client_version=CLIENT_VERSION,
-            os_version=OS_VERSION,
-        )
-        result_raw_first = exec_ctx["result_raw"]
+
+        # Events are pushed into the queue as the transport decodes them, so
+        # clients see the stream incrementally instead of after the whole
+        # upstream call has completed.
+        queue: asyncio.Queue = asyncio.Queue()
+        done = object()
+
+        async def _run() -> Dict:
+            try:
+                exec_ctx = await execute_warp_packet(
+                    actual_data=actual_data,
+                    message_type=request.message_type,
+                    timeout_seconds=90,
+                    client_version=CLIENT_VERSION,
+                    os_version=OS_VERSION,
+                    event_sink=queue.put_nowait,
+                )
+                return exec_ctx["result_raw"]
+            finally:
+                queue.put_nowait(done)
+
+        task = asyncio.create_task(_run())
 
         async def _agen():
-            result_raw = result_raw_first
-            if not result_raw.get("ok"):
-                err_obj = {"error": f"HTTP {result_raw.get('status_code')}"}
-                yield f"data: {json.dumps(err_obj, ensure_ascii=False)}\n\n"
-                yield "data: [DONE]\n\n"
-                return
-            parsed_events = result_raw.get("parsed_events", []) or []
-            for idx, ev in enumerate(parsed_events, start=1):
-                out = {
-                    "event_number": idx,
-                    "event_type": ev.get("event_type", "UNKNOWN_EVENT"),
-                    "parsed_data": ev.get("parsed_data", {}),
-                }
-                yield f"data: {json.dumps(out, ensure_ascii=False)}\n\n"
-            yield "data: [DONE]\n\n"
+            emitted = 0
+            try:
+                while True:
+                    ev = await queue.get()
+                    if ev is done:
+                        break
+                    emitted += 1
+                    out = {
+                        "event_number": ev.get("event_number", emitted),
+                        "event_type": ev.get("event_type", "UNKNOWN_EVENT"),
+                        "parsed_data": ev.get("parsed_data", {}),
+                    }
+                    yield b"data: " + json_dumpb(out) + b"\n\n"
+                try:
+                    result_raw = await task
+                except Exception as exc:
+                    yield b"data: " + json_dumpb({"error": str(exc)}) + b"\n\n"
+                    yield b"data: [DONE]\n\n"
+                    return
+                if not result_raw.get("ok"):
+                    err_obj = {"error": f"HTTP {result_raw.get('status_code')}"}
+                    yield b"data: " + json_dumpb(err_obj) + b"\n\n"
+                yield b"data: [DONE]\n\n"
+            finally:
+                task.cancel()
 
         return StreamingResponse(
             _agen(),
             media_type="text/event-stream",
-            headers={"Cache-Control": "no-cache", "Connection": "keep-alive"},
+            headers=_SSE_HEADERS,
         )
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
-
-        error_details = {"error": str(e), "error_type": type(e).__name__, "traceback": traceback.format_exc()}
-        logger.error(f"Warp SSE转发端点错误: {e}")
-        raise HTTPException(500, detail=error_details)
+        err_id = uuid.uuid4().hex[:8]
+        logger.exception(f"Warp SSE转发端点错误 [{err_id}]: {e}")
+        raise HTTPException(500, detail={"error_id": err_id, "error": str(e), "error_type": type(e).__name__})
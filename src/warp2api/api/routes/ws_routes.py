@@ -3,12 +3,10 @@
 
 from __future__ import annotations
 
-from datetime import datetime
-
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
 from warp2api.observability.logging import logger
-from ..runtime import manager
+from ..runtime import manager, now_iso
 
 router = APIRouter()
 
@@ -21,17 +19,17 @@ async def websocket_endpoint(websocket: WebSocket):
             {
                 "event": "connected",
                 "message": "WebSocket连接已建立",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now_iso(),
             }
         )
-        recent_packets = manager.packet_history[-10:]
-        for packet in recent_packets:
-            await websocket.send_json({"event": "packet_history", "packet": packet})
+        # One batched frame instead of ten; serialization is cached in the
+        # manager between appends.
+        await websocket.send_text(manager.history_snapshot())
         while True:
             data = await websocket.receive_text()
-            logger.debug(f"收到WebSocket消息: {data}")
+            logger.debug("收到WebSocket消息: %s", data)
     except WebSocketDisconnect:
         manager.disconnect(websocket)
     except Exception as e:
-        logger.error(f"WebSocket错误: {e}")
+        logger.error("WebSocket错误: %s", e)
         manager.disconnect(websocket)
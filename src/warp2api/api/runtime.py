@@ -6,55 +6,113 @@ Shared runtime state for API routes.
 
 from __future__ import annotations
 
+import asyncio
+import time
+from collections import deque
 from datetime import datetime
-from typing import Dict, List
+from itertools import islice
+from typing import Deque, Dict, Optional, Set, Tuple
 
 from fastapi import WebSocket
 
+from warp2api.infrastructure.utils.json import json_dumpb
 from warp2api.observability.logging import logger
 
+def _ws_text(message: Dict) -> str:
+    return json_dumpb(message).decode("utf-8")
+
+
+def _preview(data: Dict) -> str:
+    # json_dumpb encodes nested dicts far faster than str()/repr.
+    try:
+        raw = json_dumpb(data)
+    except TypeError:
+        s = str(data)
+        return s[:200] + "..." if len(s) > 200 else s
+    s = raw[:200].decode("utf-8", "replace")
+    return s + "..." if len(raw) > 200 else s
+
+
+# Timestamp strings at 1ms granularity: packets logged within the same
+# millisecond share one datetime allocation + isoformat call.
+_ts_cache: Tuple[str, float] = ("", 0.0)
+
+
+def now_iso() -> str:
+    global _ts_cache
+    t = time.time()
+    if t - _ts_cache[1] > 0.001:
+        _ts_cache = (datetime.fromtimestamp(t).isoformat(), t)
+    return _ts_cache[0]
+
 
 class ConnectionManager:
     def __init__(self) -> None:
-        self.active_connections: List[WebSocket] = []
-        self.packet_history: List[Dict] = []
+        # Set membership makes connect/disconnect O(1) under client churn.
+        self.active_connections: Set[WebSocket] = set()
+        # maxlen keeps the history bounded without the copy-on-trim a plain
+        # list would need.
+        self.packet_history: Deque[Dict] = deque(maxlen=100)
+        self._history_version = 0
+        self._snapshot_cache: Optional[Tuple[int, str]] = None
 
     async def connect(self, websocket: WebSocket) -> None:
         await websocket.accept()
-        self.active_connections.append(websocket)
-        logger.info(f"WebSocket连接建立，当前连接数: {len(self.active_connections)}")
+        self.active_connections.add(websocket)
+        logger.info("WebSocket连接建立，当前连接数: %d", len(self.active_connections))
 
     def disconnect(self, websocket: WebSocket) -> None:
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
-        logger.info(f"WebSocket连接断开，当前连接数: {len(self.active_connections)}")
+        self.active_connections.discard(websocket)
+        logger.info("WebSocket连接断开，当前连接数: %d", len(self.active_connections))
 
     async def broadcast(self, message: Dict) -> None:
         if not self.active_connections:
             return
 
-        disconnected = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.warning(f"发送WebSocket消息失败: {e}")
-                disconnected.append(connection)
-        for conn in disconnected:
-            self.disconnect(conn)
+        # Serialize once for all subscribers and send concurrently, so one
+        # slow client delays the broadcast by max-of-clients, not sum.
+        try:
+            payload = _ws_text(message)
+        except Exception as e:
+            logger.warning("序列化WebSocket消息失败: %s", e)
+            return
+        connections = list(self.active_connections)
+        results = await asyncio.gather(
+            *(connection.send_text(payload) for connection in connections),
+            return_exceptions=True,
+        )
+        for connection, result in zip(connections, results):
+            if isinstance(result, BaseException):
+                logger.warning("发送WebSocket消息失败: %s", result)
+                self.disconnect(connection)
+
+    def history_snapshot(self, limit: int = 10) -> str:
+        """Serialized replay frame for new subscribers.
+
+        Cached between appends so rapid reconnects don't re-serialize an
+        unchanged history.
+        """
+        cached = self._snapshot_cache
+        if cached is not None and cached[0] == self._history_version:
+            return cached[1]
+        total = len(self.packet_history)
+        packets = list(islice(self.packet_history, max(0, total - limit), None))
+        payload = _ws_text({"event": "packet_history_batch", "packets": packets})
+        self._snapshot_cache = (self._history_version, payload)
+        return payload
 
     async def log_packet(self, packet_type: str, data: Dict, size: int) -> None:
         packet_info = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
             "type": packet_type,
             "size": size,
-            "data_preview": str(data)[:200] + "..." if len(str(data)) > 200 else str(data),
+            "data_preview": _preview(data),
             "full_data": data,
         }
         self.packet_history.append(packet_info)
-        if len(self.packet_history) > 100:
-            self.packet_history = self.packet_history[-100:]
-        await self.broadcast({"event": "packet_captured", "packet": packet_info})
+        self._history_version += 1
+        if self.active_connections:
+            await self.broadcast({"event": "packet_captured", "packet": packet_info})
 
 
 manager = ConnectionManager()
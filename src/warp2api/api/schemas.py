@@ -28,53 +28,37 @@ class EncodeRequest(BaseModel):
 
     model_config = ConfigDict(extra="allow")
 
+    # Packet fields collected by get_data(), in output order. Kept as a class
+    # attribute so the hot path is a straight loop over a tuple rather than a
+    # dict walk with set lookups per request.
+    _PACKET_FIELDS = (
+        "task_context",
+        "input",
+        "settings",
+        "metadata",
+        "mcp_context",
+        "existing_suggestions",
+        "client_version",
+        "os_category",
+        "os_name",
+        "os_version",
+    )
+
     def get_data(self) -> Dict[str, Any]:
         if self.json_data is not None:
             return self.json_data
         data: Dict[str, Any] = {}
-        if self.task_context is not None:
-            data["task_context"] = self.task_context
-        if self.input is not None:
-            data["input"] = self.input
-        if self.settings is not None:
-            data["settings"] = self.settings
-        if self.metadata is not None:
-            data["metadata"] = self.metadata
-        if self.mcp_context is not None:
-            data["mcp_context"] = self.mcp_context
-        if self.existing_suggestions is not None:
-            data["existing_suggestions"] = self.existing_suggestions
-        if self.client_version is not None:
-            data["client_version"] = self.client_version
-        if self.os_category is not None:
-            data["os_category"] = self.os_category
-        if self.os_name is not None:
-            data["os_name"] = self.os_name
-        if self.os_version is not None:
-            data["os_version"] = self.os_version
-
-        skip_keys = {
-            "json_data",
-            "message_type",
-            "task_context",
-            "input",
-            "settings",
-            "metadata",
-            "mcp_context",
-            "existing_suggestions",
-            "client_version",
-            "os_category",
-            "os_name",
-            "os_version",
-        }
-        try:
-            for k, v in self.__dict__.items():
-                if v is None or k in skip_keys:
-                    continue
-                if k not in data:
+        for name in self._PACKET_FIELDS:
+            value = getattr(self, name)
+            if value is not None:
+                data[name] = value
+        # extra="allow" fields live in model_extra, so unknown packet keys
+        # pass through without iterating the declared fields again.
+        extra = self.model_extra
+        if extra:
+            for k, v in extra.items():
+                if v is not None and k not in data:
                     data[k] = v
-        except Exception:
-            pass
         return data
 
 
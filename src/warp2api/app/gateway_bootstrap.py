@@ -1,12 +1,18 @@
 from __future__ import annotations
 
-from warp2api.infrastructure.settings.settings import STRICT_ENV, strict_auth_config_ok
+import asyncio
+
 from warp2api.observability.logging import logger, set_log_file
-from warp2api.infrastructure.monitoring.account_pool_monitor import start_monitor, stop_monitor
-from warp2api.infrastructure.token_pool.repository import get_token_repository
 
 
 async def startup_tasks() -> None:
+    # Imported here so that processes which never start the server (CLI
+    # --help, bridge mode) don't pull in the monitor/repository stack.
+    from warp2api.infrastructure.monitoring.account_pool_monitor import start_monitor
+    from warp2api.infrastructure.protobuf.runtime import ensure_proto_runtime
+    from warp2api.infrastructure.settings.settings import STRICT_ENV, strict_auth_config_ok
+    from warp2api.infrastructure.token_pool.repository import get_token_repository
+
     logger.info("=" * 60)
     logger.info("warp2api unified gateway starting")
     logger.info("=" * 60)
@@ -16,24 +22,32 @@ async def startup_tasks() -> None:
     except Exception:
         pass
 
-    try:
-        from warp2api.infrastructure.protobuf.runtime import ensure_proto_runtime
+    # Proto compilation and repository setup are independent blocking I/O;
+    # overlap them instead of serializing cold start. The monitor starts
+    # afterwards so its background task finds the repo singleton built.
+    proto_res, repo_res = await asyncio.gather(
+        asyncio.to_thread(ensure_proto_runtime),
+        asyncio.to_thread(get_token_repository),
+        return_exceptions=True,
+    )
 
-        ensure_proto_runtime()
-        logger.info("✅ Protobuf runtime initialized")
-    except Exception as e:
-        logger.error("❌ Protobuf runtime init failed: %s", e)
-        raise
+    if isinstance(proto_res, BaseException):
+        logger.error("❌ Protobuf runtime init failed: %s", proto_res)
+        raise proto_res
+    logger.info("✅ Protobuf runtime initialized")
+
+    if isinstance(repo_res, BaseException):
+        logger.error("❌ Token pool repository init failed: %s", repo_res)
+        raise repo_res
+    logger.info("✅ Token pool repository initialized")
 
     try:
-        repo = get_token_repository()
-        logger.info("✅ Token pool repository initialized")
+        await start_monitor()
     except Exception as e:
-        logger.error("❌ Token pool repository init failed: %s", e)
-        raise
+        logger.warning("⚠️ token pool monitor start failed: %s", e)
 
     if STRICT_ENV:
-        stats = repo.statistics()
+        stats = repo_res.statistics()
         has_pool_tokens = int(stats.get("total", 0) or 0) > 0
         if not has_pool_tokens and not strict_auth_config_ok():
             raise RuntimeError(
@@ -41,14 +55,25 @@ async def startup_tasks() -> None:
                 "Please import token accounts in /admin/tokens first."
             )
 
-    try:
-        await start_monitor()
-    except Exception as e:
-        logger.warning("⚠️ token pool monitor start failed: %s", e)
-
 
 async def shutdown_tasks() -> None:
     try:
+        from warp2api.infrastructure.monitoring.account_pool_monitor import stop_monitor
+
         await stop_monitor()
     except Exception as e:
         logger.warning("⚠️ token pool monitor stop failed: %s", e)
+
+    try:
+        from warp2api.infrastructure.transport.warp_transport import close_httpx_client
+
+        await close_httpx_client()
+    except Exception as e:
+        logger.warning("⚠️ transport client close failed: %s", e)
+
+    try:
+        from warp2api.infrastructure.auth.jwt_auth import close_auth_client
+
+        await close_auth_client()
+    except Exception as e:
+        logger.warning("⚠️ auth client close failed: %s", e)
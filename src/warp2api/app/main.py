@@ -2,8 +2,6 @@ from __future__ import annotations
 
 import argparse
 
-from .openai_runtime import run_gateway_server
-
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="warp2api unified launcher")
@@ -12,4 +10,7 @@ def main() -> None:
     parser.add_argument("--reload", action="store_true", help="Enable autoreload")
     args = parser.parse_args()
 
+    # Resolved after arg parsing so --help never touches the runtime stack.
+    from .openai_runtime import run_gateway_server
+
     run_gateway_server(port=args.port, reload=args.reload)
@@ -1,11 +1,30 @@
 from __future__ import annotations
 
+import os
+
 from fastapi import FastAPI
 
-from warp2api.adapters.openai.app import app
+_APP_ATTRS = ("gateway_app", "openai_app", "app")
+
+
+def _resolve_app() -> FastAPI:
+    from warp2api.adapters.openai.app import app
+
+    for alias in _APP_ATTRS:
+        globals()[alias] = app
+    return app
+
+
+def __getattr__(name: str) -> FastAPI:
+    # PEP 562: defer the adapter-tree import so CLI flows that never serve
+    # HTTP (--help, bridge mode) don't pay the FastAPI app build.
+    if name in _APP_ATTRS:
+        return _resolve_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
-gateway_app: FastAPI = app
-openai_app: FastAPI = gateway_app
+if os.getenv("WARP2API_EAGER_IMPORT"):
+    _resolve_app()
 
 
 def main() -> None:
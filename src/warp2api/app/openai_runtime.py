@@ -5,7 +5,6 @@
 from __future__ import annotations
 
 from warp2api.infrastructure.settings.settings import HOST, PORT
-from .openai import gateway_app
 
 
 def _resolve_port(cli_port: int | None = None) -> int:
@@ -28,11 +27,33 @@ def run_gateway_server(port: int | None = None, reload: bool = False) -> None:
             reload_dirs=[".", "src"],
         )
     else:
+        # Imported here rather than at module level: the reload branch only
+        # needs the import string, and --help should not build the app.
+        from .openai import gateway_app
+
+        # uvicorn[standard] ships both: the C event loop and HTTP parser cut
+        # per-request overhead for every route. Fall back to uvicorn's auto
+        # selection where the C extensions are unavailable (e.g. Windows).
+        # Reload mode above keeps the default asyncio loop, which the
+        # reloader requires.
+        try:
+            import uvloop  # noqa: F401
+            loop_impl = "uvloop"
+        except ImportError:
+            loop_impl = "auto"
+        try:
+            import httptools  # noqa: F401
+            http_impl = "httptools"
+        except ImportError:
+            http_impl = "auto"
         uvicorn.run(
             gateway_app,
             host=HOST,
             port=resolved_port,
             log_level="info",
+            loop=loop_impl,
+            http=http_impl,
+            access_log=False,
         )
 
 
@@ -1,8 +1,7 @@
 from __future__ import annotations
 
-import json
+import secrets
 import time
-import uuid
 from typing import Any, AsyncGenerator, Dict, List
 
 from fastapi import HTTPException, Request
@@ -11,22 +10,33 @@ from fastapi.responses import StreamingResponse
 from warp2api.adapters.common.logging import logger
 from warp2api.adapters.common.schemas import ChatCompletionsRequest, ChatMessage
 from warp2api.application.services.gateway_access import authenticate_request, initialize_once
+from warp2api.infrastructure.utils.json import json_dumpb
 from warp2api.application.services.token_rotation_service import send_query_with_rotation
 from warp2api.domain.models.model_catalog import get_model_config
 
+_DONE = b"data: [DONE]\n\n"
+# Constant tails for the role/finish frames: the per-request header is
+# encoded once and spliced in front, instead of a full JSON encode per frame.
+_FIRST_TAIL = b',"choices":[{"index":0,"delta":{"role":"assistant"}}]}\n\n'
+_FINAL_TAIL = b',"choices":[{"index":0,"delta":{},"finish_reason":"stop"}]}\n\n'
+
 
 def _message_text(msg: ChatMessage) -> str:
     content = msg.content
     if isinstance(content, str):
+        # str.strip() returns the same object when there is nothing to
+        # strip, so the common clean case allocates nothing.
         return content.strip()
     if isinstance(content, list):
-        parts: List[str] = []
-        for seg in content:
-            if isinstance(seg, dict) and seg.get("type") == "text":
-                txt = str(seg.get("text") or "").strip()
-                if txt:
-                    parts.append(txt)
-        return "\n".join(parts).strip()
+        # Parts are stripped individually, so the joined result needs no
+        # final strip.
+        return "\n".join(
+            txt
+            for seg in content
+            if isinstance(seg, dict)
+            and seg.get("type") == "text"
+            and (txt := str(seg.get("text") or "").strip())
+        )
     return ""
 
 
@@ -63,35 +73,26 @@ async def _openai_stream_gen(
     created_ts: int,
     model_id: str,
     text: str,
-) -> AsyncGenerator[str, None]:
-    first = {
-        "id": completion_id,
-        "object": "chat.completion.chunk",
-        "created": created_ts,
-        "model": model_id,
-        "choices": [{"index": 0, "delta": {"role": "assistant"}}],
-    }
-    yield f"data: {json.dumps(first, ensure_ascii=False)}\n\n"
-
-    if text:
-        chunk = {
+) -> AsyncGenerator[bytes, None]:
+    # Encode the chunk header once per request (the JSON encoder handles any
+    # escaping in model_id) and splice prebuilt choice tails onto it; only
+    # the content frame still encodes a variable payload.
+    head = json_dumpb(
+        {
             "id": completion_id,
             "object": "chat.completion.chunk",
             "created": created_ts,
             "model": model_id,
-            "choices": [{"index": 0, "delta": {"content": text}}],
         }
-        yield f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n"
+    )
+    prefix = b"data: " + head[:-1]  # drop the closing brace
+    yield prefix + _FIRST_TAIL
 
-    final = {
-        "id": completion_id,
-        "object": "chat.completion.chunk",
-        "created": created_ts,
-        "model": model_id,
-        "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
-    }
-    yield f"data: {json.dumps(final, ensure_ascii=False)}\n\n"
-    yield "data: [DONE]\n\n"
+    if text:
+        yield prefix + b',"choices":[{"index":0,"delta":' + json_dumpb({"content": text}) + b"}]}\n\n"
+
+    yield prefix + _FINAL_TAIL
+    yield _DONE
 
 
 async def execute_chat_completions(
@@ -114,12 +115,13 @@ async def execute_chat_completions(
     except ValueError as exc:
         raise HTTPException(400, str(exc))
 
-    query = _extract_query(list(req.messages))
+    # req.messages is already a list; the reverse scan only reads it.
+    query = _extract_query(req.messages)
     if not query:
         raise HTTPException(400, "messages 中至少需要一条 user 文本消息")
 
     created_ts = int(time.time())
-    completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+    completion_id = "chatcmpl-" + secrets.token_hex(16)
     model_id = req.model or "warp-default"
 
     result = await send_query_with_rotation(
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import os
 import threading
 import time
-import uuid
+from collections import OrderedDict
 from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
 
 from pydantic import BaseModel
@@ -11,14 +13,18 @@ from pydantic import BaseModel
 from warp2api.adapters.common.logging import logger
 from warp2api.adapters.common.schemas import ChatMessage
 from warp2api.application.services.warp_request_service import execute_warp_packet
+from warp2api.infrastructure.utils.json import json_dumpb
 from warp2api.infrastructure.settings.settings import CLIENT_VERSION, OS_VERSION, WARP_COMPAT_SESSION_TTL
 
 
-def _get(d: Dict[str, Any], *names: str) -> Any:
-    for name in names:
-        if isinstance(d, dict) and name in d:
-            return d[name]
-    return None
+def _new_id() -> str:
+    """Random dashed UUID4-format id straight from os.urandom, skipping the
+    uuid.UUID construction/formatting overhead in per-message loops."""
+    b = bytearray(os.urandom(16))
+    b[6] = (b[6] & 0x0F) | 0x40
+    b[8] = (b[8] & 0x3F) | 0x80
+    h = bytes(b).hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
 
 
 def normalize_content_to_list(content: Any) -> List[Dict[str, Any]]:
@@ -74,34 +80,37 @@ class BridgeState(BaseModel):
 class SessionStateStore:
     def __init__(self, ttl_seconds: int = 1800):
         self._ttl_seconds = ttl_seconds
-        self._lock = threading.RLock()
-        self._states: Dict[str, Tuple[BridgeState, float]] = {}
-
-    def _cleanup_locked(self) -> None:
-        now = time.time()
-        expired = [k for k, (_, exp) in self._states.items() if exp <= now]
-        for key in expired:
-            self._states.pop(key, None)
+        self._lock = threading.Lock()
+        # Every access refreshes the TTL and moves the entry to the end, so
+        # the head always holds the soonest expiry; eviction only needs to
+        # pop expired heads — amortized O(1) instead of a full scan per call.
+        self._states: "OrderedDict[str, Tuple[BridgeState, float]]" = OrderedDict()
 
     def get_or_create(self, session_key: str) -> BridgeState:
         now = time.time()
         with self._lock:
-            self._cleanup_locked()
-            state_exp = self._states.get(session_key)
+            states = self._states
+            while states:
+                _, exp = next(iter(states.values()))
+                if exp > now:
+                    break
+                states.popitem(last=False)
+            state_exp = states.get(session_key)
             if state_exp is None:
                 st = BridgeState()
             else:
                 st = state_exp[0]
             ensure_tool_ids(st)
-            self._states[session_key] = (st, now + self._ttl_seconds)
+            states[session_key] = (st, now + self._ttl_seconds)
+            states.move_to_end(session_key)
             return st
 
 
 def ensure_tool_ids(state: BridgeState) -> None:
     if not state.tool_call_id:
-        state.tool_call_id = str(uuid.uuid4())
+        state.tool_call_id = _new_id()
     if not state.tool_message_id:
-        state.tool_message_id = str(uuid.uuid4())
+        state.tool_message_id = _new_id()
 
 
 _SESSION_TTL = WARP_COMPAT_SESSION_TTL
@@ -148,26 +157,32 @@ def reorder_messages_for_anthropic(history: List[ChatMessage]) -> List[ChatMessa
         else:
             expanded.append(m)
 
+    # Single forward pass replaces the old reverse scan + index-building
+    # scan: the last user/tool sighting and both tool-id indexes are all
+    # order-independent facts collected as we go.
     last_input_tool_id: Optional[str] = None
     last_input_is_tool = False
-    for m in reversed(expanded):
-        if m.role == "tool" and m.tool_call_id:
-            last_input_tool_id = m.tool_call_id
-            last_input_is_tool = True
-            break
-        if m.role == "user":
-            break
-
     tool_results_by_id: Dict[str, ChatMessage] = {}
     assistant_tc_ids: set[str] = set()
     for m in expanded:
-        if m.role == "tool" and m.tool_call_id and m.tool_call_id not in tool_results_by_id:
-            tool_results_by_id[m.tool_call_id] = m
-        if m.role == "assistant" and m.tool_calls:
-            for tc in (m.tool_calls or []):
-                tc_id = (tc or {}).get("id")
-                if isinstance(tc_id, str) and tc_id:
-                    assistant_tc_ids.add(tc_id)
+        role = m.role
+        if role == "tool":
+            tc_id = m.tool_call_id
+            if tc_id:
+                last_input_tool_id = tc_id
+                last_input_is_tool = True
+                if tc_id not in tool_results_by_id:
+                    tool_results_by_id[tc_id] = m
+        elif role == "user":
+            last_input_tool_id = None
+            last_input_is_tool = False
+        elif role == "assistant":
+            tcs = m.tool_calls
+            if tcs:
+                for tc in tcs:
+                    tc_id = (tc or {}).get("id")
+                    if isinstance(tc_id, str) and tc_id:
+                        assistant_tc_ids.add(tc_id)
 
     result: List[ChatMessage] = []
     trailing_assistant_msg: Optional[ChatMessage] = None
@@ -178,9 +193,10 @@ def reorder_messages_for_anthropic(history: List[ChatMessage]) -> List[ChatMessa
                 if m.tool_call_id:
                     tool_results_by_id.pop(m.tool_call_id, None)
             continue
-        if m.role == "assistant" and m.tool_calls:
+        tcs = m.tool_calls
+        if m.role == "assistant" and tcs:
             ids: List[str] = []
-            for tc in (m.tool_calls or []):
+            for tc in tcs:
                 tc_id = (tc or {}).get("id")
                 if isinstance(tc_id, str) and tc_id:
                     ids.append(tc_id)
@@ -207,30 +223,42 @@ def reorder_messages_for_anthropic(history: List[ChatMessage]) -> List[ChatMessa
     return result
 
 
+# Request-invariant subtrees, built once and shared by reference across
+# packets: callers only write task_context.active_task_id and append to
+# input.user_inputs.inputs, and the downstream sanitizer/codec rebuild
+# cleaned copies rather than mutating in place. Treat these as read-only;
+# they stay plain dicts (not MappingProxyType) because the sanitizer and
+# protobuf codec type-check against dict.
+_PACKET_SETTINGS = {
+    "model_config": {
+        "base": "claude-4.1-opus",
+        "planning": "gpt-5 (high reasoning)",
+        "coding": "auto",
+    },
+    "rules_enabled": False,
+    "web_context_retrieval_enabled": False,
+    "supports_parallel_tool_calls": False,
+    "planning_enabled": False,
+    "warp_drive_context_enabled": False,
+    "supports_create_files": False,
+    "use_anthropic_text_editor_tools": False,
+    "supports_long_running_commands": False,
+    "should_preserve_file_content_in_history": False,
+    "supports_todos_ui": False,
+    "supports_linked_code_blocks": False,
+    "supported_tools": [9],
+}
+_PACKET_METADATA = {"logging": {"is_autodetected_user_query": True, "entrypoint": "USER_INITIATED"}}
+
+
 def packet_template() -> Dict[str, Any]:
+    # Only the mutable leaves are fresh allocations; the constant subtrees
+    # ride along as shared references.
     return {
         "task_context": {"active_task_id": ""},
         "input": {"context": {}, "user_inputs": {"inputs": []}},
-        "settings": {
-            "model_config": {
-                "base": "claude-4.1-opus",
-                "planning": "gpt-5 (high reasoning)",
-                "coding": "auto",
-            },
-            "rules_enabled": False,
-            "web_context_retrieval_enabled": False,
-            "supports_parallel_tool_calls": False,
-            "planning_enabled": False,
-            "warp_drive_context_enabled": False,
-            "supports_create_files": False,
-            "use_anthropic_text_editor_tools": False,
-            "supports_long_running_commands": False,
-            "should_preserve_file_content_in_history": False,
-            "supports_todos_ui": False,
-            "supports_linked_code_blocks": False,
-            "supported_tools": [9],
-        },
-        "metadata": {"logging": {"is_autodetected_user_query": True, "entrypoint": "USER_INITIATED"}},
+        "settings": _PACKET_SETTINGS,
+        "metadata": _PACKET_METADATA,
     }
 
 
@@ -245,10 +273,10 @@ def map_history_to_warp_messages(
     msgs: List[Dict[str, Any]] = []
     msgs.append(
         {
-            "id": st.tool_message_id or str(uuid.uuid4()),
+            "id": st.tool_message_id or _new_id(),
             "task_id": task_id,
             "tool_call": {
-                "tool_call_id": st.tool_call_id or str(uuid.uuid4()),
+                "tool_call_id": st.tool_call_id or _new_id(),
                 "server": {"payload": "IgIQAQ=="},
             },
         }
@@ -265,7 +293,7 @@ def map_history_to_warp_messages(
             break
 
     for i, m in enumerate(history):
-        mid = str(uuid.uuid4())
+        mid = _new_id()
         if (last_input_index is not None) and (i == last_input_index):
             continue
         if m.role == "user":
@@ -278,10 +306,10 @@ def map_history_to_warp_messages(
             for tc in (m.tool_calls or []):
                 msgs.append(
                     {
-                        "id": str(uuid.uuid4()),
+                        "id": _new_id(),
                         "task_id": task_id,
                         "tool_call": {
-                            "tool_call_id": tc.get("id") or str(uuid.uuid4()),
+                            "tool_call_id": tc.get("id") or _new_id(),
                             "call_mcp_tool": {
                                 "name": (tc.get("function", {}) or {}).get("name", ""),
                                 "args": (
@@ -298,7 +326,7 @@ def map_history_to_warp_messages(
             if m.tool_call_id:
                 msgs.append(
                     {
-                        "id": str(uuid.uuid4()),
+                        "id": _new_id(),
                         "task_id": task_id,
                         "tool_call_result": {
                             "tool_call_id": m.tool_call_id,
@@ -313,6 +341,19 @@ def map_history_to_warp_messages(
     return msgs
 
 
+# Constant preamble for the SYSTEM_PROMPT attachment; per request only the
+# suffix concat remains.
+_SYSTEM_PROMPT_ALERT_PREFIX = (
+    "<ALERT>you are not allowed to call following tools:  - `read_files`\n"
+    "- `write_files`\n"
+    "- `run_commands`\n"
+    "- `list_files`\n"
+    "- `str_replace_editor`\n"
+    "- `ask_followup_question`\n"
+    "- `attempt_completion`</ALERT>"
+)
+
+
 def attach_user_and_tools_to_inputs(packet: Dict[str, Any], history: List[ChatMessage], system_prompt_text: Optional[str]) -> None:
     if not history:
         raise AssertionError("post-reorder 必须至少包含一条消息")
@@ -323,16 +364,7 @@ def attach_user_and_tools_to_inputs(packet: Dict[str, Any], history: List[ChatMe
         if system_prompt_text:
             user_query_payload["referenced_attachments"] = {
                 "SYSTEM_PROMPT": {
-                    "plain_text": (
-                        "<ALERT>you are not allowed to call following tools:  - `read_files`\n"
-                        "- `write_files`\n"
-                        "- `run_commands`\n"
-                        "- `list_files`\n"
-                        "- `str_replace_editor`\n"
-                        "- `ask_followup_question`\n"
-                        "- `attempt_completion`</ALERT>"
-                        f"{system_prompt_text}"
-                    )
+                    "plain_text": _SYSTEM_PROMPT_ALERT_PREFIX + system_prompt_text
                 }
             }
         packet["input"]["user_inputs"]["inputs"].append({"user_query": user_query_payload})
@@ -355,24 +387,31 @@ def attach_user_and_tools_to_inputs(packet: Dict[str, Any], history: List[ChatMe
 
 
 def extract_text_deltas(event_data: Dict[str, Any]) -> List[str]:
+    # Direct .get fallbacks instead of the old _get helper: these run per
+    # streamed event, and the snake/camel probe is just two dict lookups.
     deltas: List[str] = []
-    client_actions = _get(event_data, "client_actions", "clientActions")
+    client_actions = event_data.get("client_actions") or event_data.get("clientActions")
     if not isinstance(client_actions, dict):
         return deltas
-    actions = _get(client_actions, "actions", "Actions") or []
+    actions = client_actions.get("actions") or client_actions.get("Actions") or []
     for action in actions:
-        append_data = _get(action, "append_to_message_content", "appendToMessageContent")
+        if not isinstance(action, dict):
+            continue
+        append_data = action.get("append_to_message_content") or action.get("appendToMessageContent")
         if isinstance(append_data, dict):
             message = append_data.get("message", {})
-            agent_output = _get(message, "agent_output", "agentOutput") or {}
-            text = str(agent_output.get("text") or "")
-            if text:
-                deltas.append(text)
+            if isinstance(message, dict):
+                agent_output = message.get("agent_output") or message.get("agentOutput") or {}
+                text = str(agent_output.get("text") or "")
+                if text:
+                    deltas.append(text)
 
-        add_msgs = _get(action, "add_messages_to_task", "addMessagesToTask")
+        add_msgs = action.get("add_messages_to_task") or action.get("addMessagesToTask")
         if isinstance(add_msgs, dict):
             for message in add_msgs.get("messages", []) or []:
-                agent_output = _get(message, "agent_output", "agentOutput") or {}
+                if not isinstance(message, dict):
+                    continue
+                agent_output = message.get("agent_output") or message.get("agentOutput") or {}
                 text = str(agent_output.get("text") or "")
                 if text:
                     deltas.append(text)
@@ -381,17 +420,23 @@ def extract_text_deltas(event_data: Dict[str, Any]) -> List[str]:
 
 def extract_tool_call_deltas(event_data: Dict[str, Any]) -> List[Dict[str, Any]]:
     tool_deltas: List[Dict[str, Any]] = []
-    client_actions = _get(event_data, "client_actions", "clientActions")
+    client_actions = event_data.get("client_actions") or event_data.get("clientActions")
     if not isinstance(client_actions, dict):
         return tool_deltas
-    actions = _get(client_actions, "actions", "Actions") or []
+    actions = client_actions.get("actions") or client_actions.get("Actions") or []
     for action in actions:
-        add_msgs = _get(action, "add_messages_to_task", "addMessagesToTask")
+        if not isinstance(action, dict):
+            continue
+        add_msgs = action.get("add_messages_to_task") or action.get("addMessagesToTask")
         if not isinstance(add_msgs, dict):
             continue
         for message in add_msgs.get("messages", []) or []:
-            tc = _get(message, "tool_call", "toolCall") or {}
-            call_mcp = _get(tc, "call_mcp_tool", "callMcpTool") or {}
+            if not isinstance(message, dict):
+                continue
+            tc = message.get("tool_call") or message.get("toolCall")
+            if not isinstance(tc, dict):
+                continue
+            call_mcp = tc.get("call_mcp_tool") or tc.get("callMcpTool") or {}
             if not (isinstance(call_mcp, dict) and call_mcp.get("name")):
                 continue
             try:
@@ -400,7 +445,7 @@ def extract_tool_call_deltas(event_data: Dict[str, Any]) -> List[Dict[str, Any]]
                 args_str = "{}"
             tool_deltas.append(
                 {
-                    "id": tc.get("tool_call_id") or str(uuid.uuid4()),
+                    "id": tc.get("tool_call_id") or _new_id(),
                     "type": "function",
                     "function": {
                         "name": call_mcp.get("name"),
@@ -411,6 +456,9 @@ def extract_tool_call_deltas(event_data: Dict[str, Any]) -> List[Dict[str, Any]]
     return tool_deltas
 
 
+_DONE = b"data: [DONE]\n\n"
+
+
 def is_finished_event(event_data: Dict[str, Any]) -> bool:
     return "finished" in (event_data or {})
 
@@ -439,38 +487,60 @@ async def _stream_once(
     completion_id: str,
     created_ts: int,
     model_id: str,
-) -> AsyncGenerator[str, None]:
+) -> AsyncGenerator[bytes, None]:
     tool_calls_emitted = False
 
-    exec_ctx = await execute_warp_packet(
-        actual_data=packet,
-        message_type="warp.multi_agent.v1.Request",
-        timeout_seconds=90,
-        client_version=CLIENT_VERSION,
-        os_version=OS_VERSION,
-    )
-    result_raw = exec_ctx["result_raw"]
-
-    if not result_raw.get("ok"):
-        raise RuntimeError(f"warp HTTP {result_raw.get('status_code')}: {result_raw.get('error')}")
+    # Events are pumped through a queue via the transport's event_sink hook,
+    # so frames go out as Warp produces them instead of after the whole
+    # response has been collected.
+    queue: asyncio.Queue = asyncio.Queue()
+    sentinel = object()
+
+    async def _run() -> Dict[str, Any]:
+        try:
+            return await execute_warp_packet(
+                actual_data=packet,
+                message_type="warp.multi_agent.v1.Request",
+                timeout_seconds=90,
+                client_version=CLIENT_VERSION,
+                os_version=OS_VERSION,
+                event_sink=queue.put_nowait,
+            )
+        finally:
+            queue.put_nowait(sentinel)
+
+    task = asyncio.create_task(_run())
+    # Local aliases skip the per-event global lookups in this tight loop; the
+    # text/tool-call interleaving must stay event-ordered, so the extraction
+    # cannot be flattened into one batch.
+    _text_deltas = extract_text_deltas
+    _tool_deltas = extract_tool_call_deltas
+    try:
+        while True:
+            ev = await queue.get()
+            if ev is sentinel:
+                break
+            event_data = ev.get("parsed_data") or {}
 
-    parsed_events = result_raw.get("parsed_events", []) or []
-    for ev in parsed_events:
-        event_data = ev.get("parsed_data") or {}
+            for text in _text_deltas(event_data):
+                yield b"data: " + json_dumpb(_chunk(completion_id, created_ts, model_id, {'content': text})) + b"\n\n"
 
-        for text in extract_text_deltas(event_data):
-            yield f"data: {json.dumps(_chunk(completion_id, created_ts, model_id, {'content': text}), ensure_ascii=False)}\n\n"
+            for tc in _tool_deltas(event_data):
+                tool_calls_emitted = True
+                yield b"data: " + json_dumpb(_chunk(completion_id, created_ts, model_id, {'tool_calls': [{'index': 0, **tc}]})) + b"\n\n"
 
-        tcs = extract_tool_call_deltas(event_data)
-        for tc in tcs:
-            tool_calls_emitted = True
-            yield f"data: {json.dumps(_chunk(completion_id, created_ts, model_id, {'tool_calls': [{'index': 0, **tc}]}), ensure_ascii=False)}\n\n"
+            if is_finished_event(event_data):
+                finish_reason = "tool_calls" if tool_calls_emitted else "stop"
+                yield b"data: " + json_dumpb(_chunk(completion_id, created_ts, model_id, {}, finish_reason=finish_reason)) + b"\n\n"
 
-        if is_finished_event(event_data):
-            finish_reason = "tool_calls" if tool_calls_emitted else "stop"
-            yield f"data: {json.dumps(_chunk(completion_id, created_ts, model_id, {}, finish_reason=finish_reason), ensure_ascii=False)}\n\n"
+        exec_ctx = await task
+        result_raw = exec_ctx["result_raw"]
+        if not result_raw.get("ok"):
+            raise RuntimeError(f"warp HTTP {result_raw.get('status_code')}: {result_raw.get('error')}")
+    finally:
+        task.cancel()
 
-    yield "data: [DONE]\n\n"
+    yield _DONE
 
 
 async def stream_openai_sse(
@@ -478,10 +548,10 @@ async def stream_openai_sse(
     completion_id: str,
     created_ts: int,
     model_id: str,
-) -> AsyncGenerator[str, None]:
+) -> AsyncGenerator[bytes, None]:
     try:
         first = _chunk(completion_id, created_ts, model_id, {"role": "assistant"})
-        yield f"data: {json.dumps(first, ensure_ascii=False)}\n\n"
+        yield b"data: " + json_dumpb(first) + b"\n\n"
         async for part in _stream_once(packet, completion_id, created_ts, model_id):
             yield part
     except Exception as exc:
@@ -494,5 +564,5 @@ async def stream_openai_sse(
             "choices": [{"index": 0, "delta": {}, "finish_reason": "error"}],
             "error": {"message": str(exc)},
         }
-        yield f"data: {json.dumps(error_chunk, ensure_ascii=False)}\n\n"
-        yield "data: [DONE]\n\n"
+        yield b"data: " + json_dumpb(error_chunk) + b"\n\n"
+        yield _DONE
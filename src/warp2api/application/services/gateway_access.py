@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import asyncio
+import hmac
+import random
 import uuid
 from typing import Optional
 
@@ -26,8 +28,10 @@ WARMUP_REQUEST_RETRIES = WARP_COMPAT_WARMUP_RETRIES
 WARMUP_REQUEST_DELAY_S = WARP_COMPAT_WARMUP_DELAY
 WARMUP_ENABLED = WARP_COMPAT_STARTUP_WARMUP
 
-_initialized = False
-_init_lock = asyncio.Lock()
+# Event instead of bool+lock: the post-warmup fast path is a single
+# synchronous is_set() with no lock acquisition scheduled.
+_init_done = asyncio.Event()
+_init_starter_lock = asyncio.Lock()
 
 
 def _get_expected_token() -> Optional[str]:
@@ -38,7 +42,9 @@ def _get_expected_token() -> Optional[str]:
 def _authenticate_bearer(expected_token: Optional[str], authorization: Optional[str]) -> bool:
     if not expected_token or not authorization or not authorization.startswith("Bearer "):
         return False
-    return authorization[7:] == expected_token
+    # Compare bytes: compare_digest raises TypeError on non-ASCII str, and
+    # header values arrive latin-1 decoded, so client input could 500 here.
+    return hmac.compare_digest(authorization[7:].encode("utf-8"), expected_token.encode("utf-8"))
 
 
 async def authenticate_request(request: Request) -> None:
@@ -50,12 +56,13 @@ async def authenticate_request(request: Request) -> None:
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    authorization = request.headers.get("authorization") or request.headers.get("Authorization")
-    x_api_key = request.headers.get("x-api-key")
+    headers = request.headers
+    authorization = headers.get("authorization") or headers.get("Authorization")
+    x_api_key = headers.get("x-api-key")
 
     if _authenticate_bearer(expected_token, authorization):
         return
-    if x_api_key and x_api_key == expected_token:
+    if x_api_key and hmac.compare_digest(x_api_key.encode("utf-8"), expected_token.encode("utf-8")):
         return
 
     raise HTTPException(
@@ -66,16 +73,15 @@ async def authenticate_request(request: Request) -> None:
 
 
 async def initialize_once() -> None:
-    global _initialized
-    if _initialized:
+    if _init_done.is_set():
         return
 
-    async with _init_lock:
-        if _initialized:
+    async with _init_starter_lock:
+        if _init_done.is_set():
             return
 
         if not WARMUP_ENABLED:
-            _initialized = True
+            _init_done.set()
             logger.info("[Gateway] Startup warmup disabled (WARP_COMPAT_STARTUP_WARMUP=false)")
             return
 
@@ -95,7 +101,7 @@ async def initialize_once() -> None:
                 )
                 raw = result.get("result_raw", {})
                 if raw.get("ok"):
-                    _initialized = True
+                    _init_done.set()
                     return
                 raise RuntimeError(
                     f"warmup failed: HTTP {raw.get('status_code')} {raw.get('error')}"
@@ -108,6 +114,9 @@ async def initialize_once() -> None:
                     exc,
                 )
                 if attempt < WARMUP_REQUEST_RETRIES:
-                    await asyncio.sleep(WARMUP_REQUEST_DELAY_S)
+                    # Exponential backoff capped at the configured delay, with
+                    # jitter so restarting workers don't retry in lockstep.
+                    delay = min(0.1 * (2 ** attempt), WARMUP_REQUEST_DELAY_S)
+                    await asyncio.sleep(delay + random.uniform(0, 0.1))
                 else:
                     raise
@@ -1,14 +1,14 @@
 from __future__ import annotations
 
-import json
+import asyncio
 import time
 import uuid
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Dict, List
 
 from fastapi.responses import StreamingResponse
 
 from warp2api.domain.models.model_catalog import get_all_unique_models
-
+from warp2api.infrastructure.utils.json import json_dumpb, json_loads
 
 def to_openai_model_list(payload: Any) -> Dict[str, Any]:
     items = []
@@ -89,9 +89,76 @@ def completion_to_responses_payload(completion: Dict[str, Any], model_id: str) -
     }
 
 
+async def coalesce_stream(
+    source: AsyncIterator[bytes],
+    max_batch_bytes: int = 64 * 1024,
+    min_batch_bytes: int = 8 * 1024,
+    min_flush_interval_s: float = 0.02,
+):
+    """Merge bursts of already-buffered frames into a single ASGI send.
+
+    Waits for one frame, then drains whatever else the producer has queued
+    without blocking, so a bursty upstream costs one send per burst instead
+    of one per frame. The cap keeps a large backlog from delaying delivery.
+
+    The first frame is always flushed immediately to preserve time to first
+    token; afterwards small batches may wait out the remainder of
+    ``min_flush_interval_s`` for more frames, bounding the flush rate without
+    adding latency beyond that interval.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    done = object()
+    error: List[BaseException] = []
+
+    async def _pump() -> None:
+        try:
+            async for item in source:
+                queue.put_nowait(item)
+        except BaseException as e:  # propagated to the consumer below
+            error.append(e)
+        finally:
+            queue.put_nowait(done)
+
+    pump = asyncio.create_task(_pump())
+    last_flush = 0.0
+    try:
+        while True:
+            item = await queue.get()
+            if item is done:
+                break
+            parts = [item]
+            size = len(item)
+            while size < max_batch_bytes:
+                try:
+                    nxt = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    if last_flush == 0.0 or size >= min_batch_bytes:
+                        break
+                    wait = min_flush_interval_s - (time.monotonic() - last_flush)
+                    if wait <= 0:
+                        break
+                    try:
+                        nxt = await asyncio.wait_for(queue.get(), timeout=wait)
+                    except asyncio.TimeoutError:
+                        break
+                if nxt is done:
+                    queue.put_nowait(done)
+                    break
+                parts.append(nxt)
+                size += len(nxt)
+            yield parts[0] if len(parts) == 1 else b"".join(parts)
+            last_flush = time.monotonic()
+        if error:
+            raise error[0]
+    finally:
+        pump.cancel()
+
+
 async def stream_chat_to_responses(chat_stream: StreamingResponse, model: str):
     accumulated = ""
     async for line in chat_stream.body_iterator:
+        if isinstance(line, bytes):
+            line = line.decode("utf-8")
         if not line.startswith("data: "):
             continue
         payload = line[6:].strip()
@@ -106,10 +173,10 @@ async def stream_chat_to_responses(chat_stream: StreamingResponse, model: str):
                     "output_text": accumulated,
                 },
             }
-            yield f"event: response.completed\ndata: {json.dumps(done, ensure_ascii=False)}\n\n"
+            yield b"event: response.completed\ndata: " + json_dumpb(done) + b"\n\n"
             break
         try:
-            chunk = json.loads(payload)
+            chunk = json_loads(payload)
         except Exception:
             continue
         delta = ((chunk.get("choices") or [{}])[0].get("delta") or {})
@@ -117,4 +184,4 @@ async def stream_chat_to_responses(chat_stream: StreamingResponse, model: str):
         if dtext:
             accumulated += dtext
             evt = {"type": "response.output_text.delta", "delta": dtext}
-            yield f"event: response.output_text.delta\ndata: {json.dumps(evt, ensure_ascii=False)}\n\n"
+            yield b"event: response.output_text.delta\ndata: " + json_dumpb(evt) + b"\n\n"
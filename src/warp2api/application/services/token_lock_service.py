@@ -10,6 +10,12 @@ _LOCKS_GUARD = asyncio.Lock()
 
 
 async def _get_lock(token_id: int) -> asyncio.Lock:
+    # Optimistic read first: dict lookups are atomic under the GIL, so the
+    # common case (lock already exists) never touches the global guard and
+    # concurrent callers for different tokens don't serialize on it.
+    lock = _LOCKS.get(token_id)
+    if lock is not None:
+        return lock
     async with _LOCKS_GUARD:
         lock = _LOCKS.get(token_id)
         if lock is None:
@@ -18,6 +24,16 @@ async def _get_lock(token_id: int) -> asyncio.Lock:
         return lock
 
 
+def discard_token_lock(token_id: int) -> None:
+    """Drop the cached lock for a removed token so _LOCKS doesn't grow
+    unbounded across rotations. A currently-held lock is left in place;
+    its holder still releases it and the entry goes away on the next
+    delete."""
+    lock = _LOCKS.get(token_id)
+    if lock is not None and not lock.locked():
+        _LOCKS.pop(token_id, None)
+
+
 @asynccontextmanager
 async def token_lock(token_id: int) -> AsyncIterator[None]:
     lock = await _get_lock(token_id)
@@ -26,4 +42,3 @@ async def token_lock(token_id: int) -> AsyncIterator[None]:
         yield
     finally:
         lock.release()
-
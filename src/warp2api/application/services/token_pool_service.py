@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Dict, Iterable, List, Optional
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from warp2api.infrastructure.utils.datetime import utcnow_iso, parse_iso, utcnow_timestamp
 from warp2api.infrastructure.settings.settings import get_token_db_path
 from warp2api.infrastructure.token_pool.repository import get_token_repository
 from warp2api.domain.protocols.token_repository import TokenRepositoryProtocol
 
+from warp2api.application.services.token_lock_service import discard_token_lock
 from warp2api.application.services.token_refresh_service import TokenRefreshService
 from warp2api.application.services.token_runtime_service import TokenRuntimeService
 
@@ -17,6 +19,11 @@ ALLOWED_STATUSES = {"active", "cooldown",
 
 _parse_iso = parse_iso
 
+# How long readiness/statistics snapshots may be served from cache. Health
+# probes (k8s liveness, uptime monitors) hit these paths far more often than
+# the pool actually changes; 0.5s staleness is invisible to them.
+_STATUS_CACHE_TTL_S = 0.5
+
 
 class TokenPoolService:
     """Facade for token pool operations.
@@ -29,6 +36,7 @@ class TokenPoolService:
         self.repo: TokenRepositoryProtocol = get_token_repository()
         self._refresh = TokenRefreshService(self.repo)
         self._runtime = TokenRuntimeService(self.repo)
+        self._status_cache: Dict[str, Tuple[float, Any]] = {}
 
     # ------------------------------------------------------------------
     # CRUD
@@ -49,6 +57,7 @@ class TokenPoolService:
             result="ok",
             detail=f"inserted={result['inserted']} duplicated={result['duplicated']}",
         )
+        self._invalidate_snapshots()
         return result
 
     @staticmethod
@@ -115,6 +124,7 @@ class TokenPoolService:
                 f"updated={result['updated']} invalid={result['invalid']}"
             ),
         )
+        self._invalidate_snapshots()
         return result
 
     def add_token(self, token: str, actor: str = "admin") -> Dict[str, Any]:
@@ -133,6 +143,7 @@ class TokenPoolService:
             result="ok",
             detail=f"status={status!r}",
         )
+        self._invalidate_snapshots()
         data = self.repo.get_token(token_id)
         return data or {}
 
@@ -150,6 +161,8 @@ class TokenPoolService:
             result="ok",
             detail="deleted",
         )
+        self._invalidate_snapshots()
+        discard_token_lock(token_id)
         return {"deleted": True, "id": token_id}
 
     def batch_delete_tokens(self, token_ids: Iterable[int], actor: str) -> Dict[str, Any]:
@@ -165,6 +178,9 @@ class TokenPoolService:
                 f"missing={result['missing']}"
             ),
         )
+        self._invalidate_snapshots()
+        for token_id in ids:
+            discard_token_lock(token_id)
         return result
 
     # ------------------------------------------------------------------
@@ -181,7 +197,9 @@ class TokenPoolService:
         return await self._refresh.refresh_token(token_id, actor=actor)
 
     async def refresh_all(self, actor: str) -> Dict[str, Any]:
-        return await self._refresh.refresh_all(actor=actor)
+        result = await self._refresh.refresh_all(actor=actor)
+        self._invalidate_snapshots()
+        return result
 
     # ------------------------------------------------------------------
     # Runtime result tracking (delegated)
@@ -197,16 +215,30 @@ class TokenPoolService:
 
     def mark_runtime_request_result(self, token_id: int, result: Dict[str, Any], actor: str = "runtime") -> None:
         self._runtime.mark_runtime_request_result(token_id, result, actor=actor)
+        self._invalidate_snapshots()
 
     def mark_runtime_refresh_error(self, token_id: int, error: Exception, actor: str = "runtime") -> None:
         self._runtime.mark_runtime_refresh_error(token_id, error, actor=actor)
+        self._invalidate_snapshots()
 
     # ------------------------------------------------------------------
     # Statistics & readiness
     # ------------------------------------------------------------------
 
+    def _cached_snapshot(self, key: str, compute: Callable[[], Any]) -> Any:
+        now = time.monotonic()
+        hit = self._status_cache.get(key)
+        if hit is not None and now - hit[0] < _STATUS_CACHE_TTL_S:
+            return hit[1]
+        value = compute()
+        self._status_cache[key] = (now, value)
+        return value
+
+    def _invalidate_snapshots(self) -> None:
+        self._status_cache.clear()
+
     def statistics(self) -> Dict[str, Any]:
-        return self.repo.statistics()
+        return self._cached_snapshot("statistics", self.repo.statistics)
 
     def events(self, limit: int = 100) -> List[Dict[str, Any]]:
         return self.repo.list_audit_logs(limit=limit)
@@ -216,6 +248,9 @@ class TokenPoolService:
         return get_monitor_status()
 
     def readiness(self) -> Dict[str, Any]:
+        return self._cached_snapshot("readiness", self._compute_readiness)
+
+    def _compute_readiness(self) -> Dict[str, Any]:
         items = self.repo.list_tokens()
         now_ts = utcnow_timestamp()
 
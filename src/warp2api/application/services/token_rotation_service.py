@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from warp2api.infrastructure.utils.datetime import parse_iso, utcnow_timestamp
 from warp2api.infrastructure.settings.settings import (
@@ -192,10 +192,24 @@ async def send_protobuf_with_rotation(
     os_version: Optional[str] = None,
     max_token_attempts: int = 4,
     model_tag: Optional[str] = None,
+    event_sink: Optional[Callable[[Dict[str, Any]], None]] = None,
 ) -> Dict[str, Any]:
     attempts: List[Dict[str, Any]] = []
     last_result: Dict[str, Any] = {
         "ok": False, "status_code": 503, "error": "no token attempted"}
+
+    # Once any event has reached the caller's sink, part of the stream has
+    # already been delivered to the client; replaying the request on retry or
+    # rotation would duplicate those events. Track first use and stop both
+    # retry loops as soon as an attempt has streamed anything.
+    streamed = False
+    sink = event_sink
+    if event_sink is not None:
+        def sink(event: Dict[str, Any], _orig: Callable[[Dict[str, Any]], None] = event_sink) -> None:
+            nonlocal streamed
+            streamed = True
+            _orig(event)
+
     candidates = _select_pool_candidates(max_token_attempts=max_token_attempts)
 
     if not candidates:
@@ -214,6 +228,10 @@ async def send_protobuf_with_rotation(
         }
 
     for candidate in candidates:
+        if streamed:
+            # Belt and braces for the bookkeeping paths between attempts: a
+            # partially delivered stream must never reach another candidate.
+            break
         pool = get_token_pool_service()
         token_id = int(candidate["id"])
         refresh_token = candidate["refresh_token"]
@@ -238,6 +256,7 @@ async def send_protobuf_with_rotation(
                             timeout_seconds=timeout_seconds,
                             client_version=client_version or CLIENT_VERSION,
                             os_version=os_version or OS_VERSION,
+                            event_sink=sink,
                         )
                     except Exception as exc:
                         result = {"ok": False,
@@ -259,7 +278,7 @@ async def send_protobuf_with_rotation(
 
                     if result.get("ok"):
                         break
-                    if req_try >= _REQUEST_RETRY_COUNT or not _is_retryable_result(result):
+                    if streamed or req_try >= _REQUEST_RETRY_COUNT or not _is_retryable_result(result):
                         break
 
                     delay_s = (_REQUEST_RETRY_BASE_DELAY_MS * req_try) / 1000.0
@@ -268,7 +287,7 @@ async def send_protobuf_with_rotation(
 
                 pool.mark_runtime_request_result(
                     token_id, final_result, actor="runtime")
-                if final_result.get("ok") or not _should_rotate_token(final_result):
+                if final_result.get("ok") or streamed or not _should_rotate_token(final_result):
                     final_result["attempts"] = attempts
                     if model_tag is not None:
                         final_result["model_tag"] = model_tag
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Tuple
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from warp2api.infrastructure.protobuf.schema_sanitizer import sanitize_mcp_input_schema_in_packet
 
@@ -34,9 +34,11 @@ async def execute_warp_packet(
     timeout_seconds: int,
     client_version: str,
     os_version: str,
+    event_sink: Optional[Callable[[Dict[str, Any]], None]] = None,
 ) -> Dict[str, Any]:
-    wrapped = sanitize_mcp_input_schema_in_packet({"json_data": actual_data})
-    safe_data = wrapped.get("json_data", actual_data)
+    # The sanitizer accepts the packet root directly; the or-fallback keeps
+    # the old behavior of preserving the input when everything cleans away.
+    safe_data = sanitize_mcp_input_schema_in_packet(actual_data) or actual_data
 
     query, model_tag = extract_query_and_model_from_packet(safe_data)
     protobuf_bytes = encode_request_packet(safe_data, message_type)
@@ -47,6 +49,7 @@ async def execute_warp_packet(
         client_version=client_version,
         os_version=os_version,
         model_tag=model_tag,
+        event_sink=event_sink,
     )
 
     return {
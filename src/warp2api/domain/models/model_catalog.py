@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import functools
 import time
-from typing import Dict, List, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple
 
 
 def _build_supported_models() -> List[Tuple[str, str, int]]:
@@ -64,11 +66,15 @@ def normalize_model_name(model_name: str) -> str:
     return name
 
 
-def get_model_config(model_name: str) -> Dict[str, str]:
+@functools.lru_cache(maxsize=128)
+def get_model_config(model_name: str) -> Mapping[str, str]:
+    # Cached per model name; the read-only proxy keeps the shared entry safe
+    # from accidental caller mutation. Unknown names are not cached (the
+    # ValueError propagates before lru_cache stores anything).
     base_model = normalize_model_name(model_name)
     if base_model not in ALL_KNOWN_MODELS:
         raise ValueError(f"Unsupported model: {base_model}")
-    return {"base": base_model, "planning": "auto", "coding": "auto"}
+    return MappingProxyType({"base": base_model, "planning": "auto", "coding": "auto"})
 
 
 def _model_item(model_id: str, display: str, sort: int = 0, vision: bool = True, category: str = "agent") -> Dict:
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from typing import Optional
 
 
@@ -63,5 +63,4 @@ class TokenAccount:
 
     def to_dict(self) -> dict:
         """Convert to the same dict format used by repository._row_to_public."""
-        from dataclasses import asdict
         return asdict(self)
@@ -7,10 +7,12 @@ Handles JWT token management, refresh, and validation.
 Integrates functionality from refresh_jwt.py.
 """
 import base64
+import functools
 import json
 import os
 import time
 from typing import Optional, List
+from urllib.parse import parse_qs, urlparse
 import httpx
 
 from warp2api.infrastructure.settings.settings import (
@@ -26,8 +28,36 @@ from warp2api.infrastructure.settings.settings import (
 from warp2api.observability.logging import logger
 
 
+_auth_client: Optional[httpx.AsyncClient] = None
+
+
+def get_auth_client() -> httpx.AsyncClient:
+    """Shared pooled client for the auth endpoints (same pattern as warp_transport)."""
+    global _auth_client
+    if _auth_client is None:
+        _auth_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0),
+            trust_env=False,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+    return _auth_client
+
+
+async def close_auth_client() -> None:
+    """Close the shared auth client so keepalive connections don't leak."""
+    global _auth_client
+    if _auth_client is not None:
+        client, _auth_client = _auth_client, None
+        await client.aclose()
+
+
+@functools.lru_cache(maxsize=256)
 def decode_jwt_payload(token: str) -> dict:
-    """Decode JWT payload to check expiration"""
+    """Decode JWT payload to check expiration.
+
+    Decoding is pure in the token string, so results are memoized; callers
+    must treat the returned dict as read-only.
+    """
     try:
         parts = token.split('.')
         if len(parts) != 3:
@@ -91,9 +121,8 @@ def get_refresh_token_candidates(refresh_token_override: Optional[str] = None) -
 def _extract_google_api_key_from_refresh_url() -> str:
     try:
         # REFRESH_URL like: https://app.warp.dev/proxy/token?key=API_KEY
-        from urllib.parse import urlparse, parse_qs as _parse_qs
         parsed = urlparse(REFRESH_URL)
-        qs = _parse_qs(parsed.query)
+        qs = parse_qs(parsed.query)
         key = qs.get("key", [""])[0]
         return key
     except Exception:
@@ -120,20 +149,20 @@ async def _refresh_via_securetoken(refresh_token: str) -> dict:
         "grant_type": "refresh_token",
         "refresh_token": refresh_token,
     }
-    async with httpx.AsyncClient(timeout=httpx.Timeout(30.0), trust_env=False) as client:
-        resp = await client.post(url, headers=headers, json=payload)
-        if resp.status_code != 200:
-            raise RuntimeError(f"securetoken refresh failed: HTTP {resp.status_code} {resp.text[:200]}")
-        data = resp.json()
-        token = str(data.get("id_token") or "").strip()
-        if not token:
-            raise RuntimeError(f"securetoken refresh missing id_token: {data}")
-        return {
-            "access_token": token,
-            "refresh_token": data.get("refresh_token") or refresh_token,
-            "expires_in": data.get("expires_in"),
-            "source": "securetoken",
-        }
+    client = get_auth_client()
+    resp = await client.post(url, headers=headers, json=payload)
+    if resp.status_code != 200:
+        raise RuntimeError(f"securetoken refresh failed: HTTP {resp.status_code} {resp.text[:200]}")
+    data = resp.json()
+    token = str(data.get("id_token") or "").strip()
+    if not token:
+        raise RuntimeError(f"securetoken refresh missing id_token: {data}")
+    return {
+        "access_token": token,
+        "refresh_token": data.get("refresh_token") or refresh_token,
+        "expires_in": data.get("expires_in"),
+        "source": "securetoken",
+    }
 
 
 async def refresh_jwt_token(refresh_token_override: Optional[str] = None) -> dict:
@@ -305,12 +334,12 @@ async def _create_anonymous_user() -> dict:
         }
     }
     body = {"query": query, "variables": variables, "operationName": "CreateAnonymousUser"}
-    async with httpx.AsyncClient(timeout=httpx.Timeout(30.0), trust_env=False) as client:
-        resp = await client.post(_ANON_GQL_URL, headers=headers, json=body)
-        if resp.status_code != 200:
-            raise RuntimeError(f"CreateAnonymousUser failed: HTTP {resp.status_code} {resp.text[:200]}")
-        data = resp.json()
-        return data
+    client = get_auth_client()
+    resp = await client.post(_ANON_GQL_URL, headers=headers, json=body)
+    if resp.status_code != 200:
+        raise RuntimeError(f"CreateAnonymousUser failed: HTTP {resp.status_code} {resp.text[:200]}")
+    data = resp.json()
+    return data
 
 
 async def _exchange_id_token_for_refresh_token(id_token: str) -> dict:
@@ -328,11 +357,11 @@ async def _exchange_id_token_for_refresh_token(id_token: str) -> dict:
         "returnSecureToken": "true",
         "token": id_token,
     }
-    async with httpx.AsyncClient(timeout=httpx.Timeout(30.0), trust_env=False) as client:
-        resp = await client.post(url, headers=headers, data=form)
-        if resp.status_code != 200:
-            raise RuntimeError(f"signInWithCustomToken failed: HTTP {resp.status_code} {resp.text[:200]}")
-        return resp.json()
+    client = get_auth_client()
+    resp = await client.post(url, headers=headers, data=form)
+    if resp.status_code != 200:
+        raise RuntimeError(f"signInWithCustomToken failed: HTTP {resp.status_code} {resp.text[:200]}")
+    return resp.json()
 
 
 async def acquire_anonymous_access_token() -> str:
@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import asyncio
 import time
+from datetime import datetime
 from typing import Dict, Optional
 
 from warp2api.application.services.token_pool_service import get_token_pool_service
@@ -61,8 +62,6 @@ def _parse_ts(raw: object) -> float:
             if v > 1e12:
                 return v / 1000.0
             return v
-        from datetime import datetime
-
         return datetime.fromisoformat(s.replace("Z", "+00:00")).timestamp()
     except Exception:
         return 0.0
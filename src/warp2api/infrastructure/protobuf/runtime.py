@@ -36,6 +36,12 @@ _pool: Optional[descriptor_pool.DescriptorPool] = None
 ALL_MSGS: List[str] = []
 _RUNTIME_LOCK = threading.RLock()
 _MSG_CLASS_CACHE: Dict[str, Any] = {}
+_RUNTIME_VERSION = 0
+
+
+def runtime_version() -> int:
+    """Monotonic counter bumped whenever the descriptor pool is (re)loaded."""
+    return _RUNTIME_VERSION
 
 
 def _find_proto_files(root: pathlib.Path) -> List[str]:
@@ -99,7 +105,7 @@ def _build_descset(proto_files: List[str], includes: List[str]) -> bytes:
 
 
 def _load_pool_from_descset(descset: bytes):
-    global _pool, ALL_MSGS
+    global _pool, ALL_MSGS, _RUNTIME_VERSION
     fds = descriptor_pb2.FileDescriptorSet()
     fds.ParseFromString(descset)
     pool = descriptor_pool.DescriptorPool()
@@ -117,6 +123,7 @@ def _load_pool_from_descset(descset: bytes):
             walk(m, pkg)
     _pool, ALL_MSGS = pool, names
     _MSG_CLASS_CACHE.clear()
+    _RUNTIME_VERSION += 1
     log(f"proto loaded: {len(ALL_MSGS)} message type(s)")
 
 
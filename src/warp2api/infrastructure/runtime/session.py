@@ -64,7 +64,7 @@ class GlobalSessionManager:
         self._session.messages.append(message)
         self._session.last_activity = time.time()
         
-        logger.debug(f"Added {role} message to session: {content[:100]}...")
+        logger.debug("Added %s message to session: %.100s...", role, content)
         return message_id
     
     def get_session_history(self) -> List[SessionMessage]:
@@ -83,13 +83,13 @@ class GlobalSessionManager:
             if not content and not tool_calls and role != "tool":
                 continue
             self.add_message_from_openai(role, content, tool_calls, tool_call_id)
-        logger.debug(f"Updated session with {len(openai_messages)} OpenAI messages")
+        logger.debug("Updated session with %d OpenAI messages", len(openai_messages))
     
     def extract_current_user_query(self, openai_messages: List[Dict[str, Any]]) -> Optional[str]:
         for msg in reversed(openai_messages):
             if msg.get("role") == "user":
                 query = msg.get("content", "")
-                logger.debug(f"Extracted current user query: {query[:100]}...")
+                logger.debug("Extracted current user query: %.100s...", query)
                 return query
         return None
     
@@ -99,12 +99,12 @@ class GlobalSessionManager:
             if msg.role == "user" and msg.content == current_user_query:
                 continue
             history.append(msg)
-        logger.debug(f"Retrieved {len(history)} history messages (excluding current query)")
+        logger.debug("Retrieved %d history messages (excluding current query)", len(history))
         return history
     
     def set_active_task_id(self, task_id: str) -> None:
         self._session.active_task_id = task_id
-        logger.debug(f"Set active task_id: {task_id}")
+        logger.debug("Set active task_id: %s", task_id)
     
     def get_active_task_id(self) -> Optional[str]:
         return self._session.active_task_id
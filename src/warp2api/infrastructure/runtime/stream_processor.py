@@ -27,7 +27,7 @@ class StreamProcessor:
         session = StreamSession(stream_id, message_type, self.websocket_manager)
         self.active_streams[stream_id] = session
         
-        logger.info(f"创建流式会话: {stream_id}, 消息类型: {message_type}")
+        logger.info("创建流式会话: %s, 消息类型: %s", stream_id, message_type)
         return session
     
     async def get_stream_session(self, stream_id: str) -> Optional['StreamSession']:
@@ -40,7 +40,7 @@ class StreamProcessor:
             session = self.active_streams[stream_id]
             await session.close()
             del self.active_streams[stream_id]
-            logger.info(f"关闭流式会话: {stream_id}")
+            logger.info("关闭流式会话: %s", stream_id)
     
     async def process_stream_chunk(self, stream_id: str, chunk_data: bytes) -> Dict[str, Any]:
         """处理流式数据块"""
@@ -83,7 +83,7 @@ class StreamSession:
         self.total_size += len(chunk_data)
         self.chunks.append(chunk_data)
         
-        logger.debug(f"流式会话 {self.session_id}: 处理数据块 {self.chunk_count}, 大小 {len(chunk_data)} 字节")
+        logger.debug("流式会话 %s: 处理数据块 %d, 大小 %d 字节", self.session_id, self.chunk_count, len(chunk_data))
         
         chunk_result = {
             "chunk_index": self.chunk_count - 1,
@@ -108,7 +108,7 @@ class StreamSession:
         except Exception as e:
             chunk_result["error"] = str(e)
             chunk_result["parsed_successfully"] = False
-            logger.warning(f"数据块解析失败: {e}")
+            logger.warning("数据块解析失败: %s", e)
             
             if self.websocket_manager:
                 await self.websocket_manager.broadcast({
@@ -123,7 +123,7 @@ class StreamSession:
         """完成流式处理，尝试拼接完整消息"""
         duration = (datetime.now() - self.start_time).total_seconds()
         
-        logger.info(f"流式会话 {self.session_id} 完成: {self.chunk_count} 块, 总大小 {self.total_size} 字节, 耗时 {duration:.2f}s")
+        logger.info("流式会话 %s 完成: %d 块, 总大小 %d 字节, 耗时 %.2fs", self.session_id, self.chunk_count, self.total_size, duration)
         
         result = {
             "session_id": self.session_id,
@@ -157,14 +157,14 @@ class StreamSession:
             
             self.complete_message = complete_json
             
-            logger.info(f"流式消息拼接成功: {len(complete_data)} 字节")
+            logger.info("流式消息拼接成功: %d 字节", len(complete_data))
             
         except Exception as e:
             result["complete_message"] = {
                 "error": str(e),
                 "assembly_successful": False
             }
-            logger.warning(f"流式消息拼接失败: {e}")
+            logger.warning("流式消息拼接失败: %s", e)
         
         if self.websocket_manager:
             await self.websocket_manager.broadcast({
@@ -181,7 +181,7 @@ class StreamSession:
         self.parsed_chunks.clear()
         self.complete_message = None
         
-        logger.debug(f"流式会话 {self.session_id} 已关闭")
+        logger.debug("流式会话 %s 已关闭", self.session_id)
 
 
 class StreamPacketAnalyzer:
@@ -3,7 +3,7 @@ from __future__ import annotations
 import base64
 import binascii
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 import httpx
 
@@ -14,6 +14,18 @@ from warp2api.infrastructure.protobuf.utils import protobuf_to_dict
 from .event_parser import detect_event_type, extract_text_from_event, extract_tool_calls_from_event
 
 
+# Request-invariant pieces, built once: the per-call header dict is a copy
+# plus the three fields that actually vary.
+_DEFAULT_URL = "https://app.warp.dev/ai/multi-agent"
+_BASE_HEADERS = {
+    "x-warp-client-id": "warp-app",
+    "x-warp-os-category": OS_CATEGORY,
+    "x-warp-os-name": OS_NAME,
+    "content-type": "application/x-protobuf",
+    "accept": "text/event-stream",
+    "accept-encoding": "identity",
+}
+
 _httpx_client: Optional[httpx.AsyncClient] = None
 
 
@@ -30,6 +42,14 @@ def get_httpx_client() -> httpx.AsyncClient:
     return _httpx_client
 
 
+async def close_httpx_client() -> None:
+    """Close the shared transport client so keepalive connections don't leak."""
+    global _httpx_client
+    if _httpx_client is not None:
+        client, _httpx_client = _httpx_client, None
+        await client.aclose()
+
+
 def _decode_payload_to_bytes(payload: str) -> Optional[bytes]:
     s = (payload or "").strip()
     if not s:
@@ -54,20 +74,16 @@ async def send_warp_protobuf_request(
     os_version: Optional[str] = None,
     host: str = "app.warp.dev",
     path: str = "/ai/multi-agent",
+    event_sink: Optional[Callable[[Dict[str, Any]], None]] = None,
 ) -> Dict[str, Any]:
     headers = {
-        "x-warp-client-id": "warp-app",
+        **_BASE_HEADERS,
         "x-warp-client-version": client_version or CLIENT_VERSION,
-        "x-warp-os-category": OS_CATEGORY,
-        "x-warp-os-name": OS_NAME,
         "x-warp-os-version": os_version or OS_VERSION,
-        "content-type": "application/x-protobuf",
-        "accept": "text/event-stream",
-        "accept-encoding": "identity",
         "authorization": f"Bearer {jwt}",
     }
 
-    url = f"https://{host}{path}"
+    url = _DEFAULT_URL if host == "app.warp.dev" and path == "/ai/multi-agent" else f"https://{host}{path}"
     client = get_httpx_client()
 
     try:
@@ -131,13 +147,19 @@ async def send_warp_protobuf_request(
 
                     events_count += 1
                     event_type = detect_event_type(event_data)
-                    parsed_events.append(
-                        {
-                            "event_number": events_count,
-                            "event_type": event_type,
-                            "parsed_data": event_data,
-                        }
-                    )
+                    parsed_event = {
+                        "event_number": events_count,
+                        "event_type": event_type,
+                        "parsed_data": event_data,
+                    }
+                    parsed_events.append(parsed_event)
+                    if event_sink is not None:
+                        # Push to the caller as events decode so SSE relays can
+                        # forward incrementally instead of after the full read.
+                        try:
+                            event_sink(parsed_event)
+                        except Exception as exc:
+                            logger.warning("event sink failed: %s", exc)
 
                     if "finished" in event_data:
                         break
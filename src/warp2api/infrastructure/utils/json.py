@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    def json_dumpb(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    json_loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is a declared dependency
+    def json_dumpb(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    json_loads = json.loads
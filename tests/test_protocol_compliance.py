@@ -1,3 +1,4 @@
+import importlib
 import os
 import json
 
@@ -113,3 +114,60 @@ def test_openai_responses_stream_shape(monkeypatch):
     assert r.status_code == 200
     assert "response.output_text.delta" in r.text
     assert "response.completed" in r.text
+
+
+def _gateway_stream_response(req):
+    # Real gateway generator (bytes frames), not a hand-rolled str stub: the
+    # adapter translators must consume exactly what the gateway emits.
+    from warp2api.application.services.chat_gateway_service import _openai_stream_gen
+
+    return StreamingResponse(
+        _openai_stream_gen(
+            completion_id="chatcmpl-test",
+            created_ts=123,
+            model_id=req.model or "gpt-5",
+            text="hello",
+        ),
+        media_type="text/event-stream",
+    )
+
+
+def test_anthropic_stream_translates_gateway_bytes(monkeypatch):
+    # The package re-exports `router` (the APIRouter), which shadows the
+    # submodule on attribute access; go through importlib for the module.
+    anthropic_router = importlib.import_module("warp2api.adapters.anthropic.router")
+
+    async def _fake_chat(req, request=None):
+        return _gateway_stream_response(req)
+
+    monkeypatch.setattr(anthropic_router, "execute_chat_completions", _fake_chat)
+    c = TestClient(openai_app)
+    r = c.post(
+        "/v1/messages",
+        headers={"anthropic-version": "2023-06-01"},
+        json={
+            "model": "claude-4.1-opus",
+            "max_tokens": 100,
+            "stream": True,
+            "messages": [{"role": "user", "content": "hi"}],
+        },
+    )
+    assert r.status_code == 200
+    assert "event: message_start" in r.text
+    assert '"text_delta"' in r.text and "hello" in r.text
+    assert "event: message_stop" in r.text
+
+
+def test_gemini_stream_translates_gateway_bytes(monkeypatch):
+    gemini_router = importlib.import_module("warp2api.adapters.gemini.router")
+
+    async def _fake_chat(req, request=None):
+        return _gateway_stream_response(req)
+
+    monkeypatch.setattr(gemini_router, "execute_chat_completions", _fake_chat)
+    c = TestClient(openai_app)
+    body = {"contents": [{"role": "user", "parts": [{"text": "hi"}]}]}
+    r = c.post("/v1beta/models/gemini-2.5-pro:streamGenerateContent", json=body)
+    assert r.status_code == 200
+    assert "hello" in r.text
+    assert "STOP" in r.text
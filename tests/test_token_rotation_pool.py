@@ -311,3 +311,48 @@ def test_refresh_token_merges_duplicate_refresh_token(monkeypatch, tmp_path: Pat
     assert merged_source is None
     assert merged_target is not None
     assert merged_target["status"] == "active"
+
+
+def test_streamed_events_suppress_retry_and_rotation(monkeypatch, tmp_path: Path):
+    db_path = tmp_path / "token_pool3.db"
+    monkeypatch.setenv("WARP_TOKEN_DB_PATH", str(db_path))
+
+    svc = get_token_pool_service()
+    svc.batch_import(["rt-test-010", "rt-test-011"], actor="test")
+
+    async def _fake_refresh(*args, **kwargs):
+        return {"access_token": "jwt-ok"}
+
+    calls = []
+
+    async def _fake_send(**kwargs):
+        # Stream two events, then fail retryably mid-stream: a replay would
+        # duplicate the already-delivered events on the client.
+        calls.append(1)
+        sink = kwargs["event_sink"]
+        sink({"event_number": 1, "parsed_data": {"a": 1}})
+        sink({"event_number": 2, "parsed_data": {"b": 2}})
+        return {"ok": False, "status_code": 0, "error": "timeout: read timed out"}
+
+    monkeypatch.setattr(
+        "warp2api.application.services.token_rotation_service.refresh_jwt_token",
+        _fake_refresh,
+    )
+    monkeypatch.setattr(
+        "warp2api.application.services.token_rotation_service.send_warp_protobuf_request",
+        _fake_send,
+    )
+
+    received = []
+    result = asyncio.run(
+        send_protobuf_with_rotation(
+            protobuf_bytes=b"abc",
+            timeout_seconds=10,
+            max_token_attempts=2,
+            event_sink=received.append,
+        )
+    )
+
+    assert result["ok"] is False
+    assert len(calls) == 1
+    assert [ev["event_number"] for ev in received] == [1, 2]